@@ -26,9 +26,13 @@ FACE_DETECTION_MODEL = 'hog'  # or 'cnn' for better accuracy
 
 # Camera settings - Optimized for performance
 CAMERA_INDEX = 0
-CAMERA_WIDTH = 1280  # Higher resolution for better accuracy
-CAMERA_HEIGHT = 720
-CAMERA_FPS = 60  # Higher FPS for better responsiveness
+# Tracking capture - recognizer input is 640x360, larger captures are only downscaled away
+CAMERA_WIDTH = 640
+CAMERA_HEIGHT = 360
+CAMERA_FPS = 30
+# Face preview / registration / login capture - 4:3 like the 400x300 preview
+FACE_CAMERA_WIDTH = 640
+FACE_CAMERA_HEIGHT = 480
 
 # Mouse control settings - Optimized for responsiveness
 MOUSE_SENSITIVITY = 1.2
@@ -60,8 +64,16 @@ BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 ASSETS_DIR = os.path.join(BASE_DIR, "assets")
 IMAGES_DIR = os.path.join(ASSETS_DIR, "images")
 GIFS_DIR = os.path.join(ASSETS_DIR, "gifs")
+MODELS_DIR = os.path.join(ASSETS_DIR, "models")
+# MediaPipe Tasks hand landmarker model - enables LIVE_STREAM (async) mode when present
+HAND_LANDMARKER_MODEL_PATH = os.path.join(MODELS_DIR, "hand_landmarker.task")
 USER_DATA_DIR = os.path.join(BASE_DIR, "user_data")
 
+# Resident gesture server (python -m src.gesture.gesture_server) - skips MediaPipe cold start
+# Address and authkey are per-user and generated at runtime (see src/gesture/gesture_server.py)
+USE_GESTURE_SERVER = os.environ.get("GESTURE_SERVER") == "1"
+GESTURE_SERVER_CONNECT_TIMEOUT = 1.0  # Seconds - the server is busy while another client is attached
+
 # Ensure directories exist
 for directory in [ASSETS_DIR, IMAGES_DIR, GIFS_DIR, USER_DATA_DIR]:
     os.makedirs(directory, exist_ok=True)
\ No newline at end of file
@@ -8,12 +8,13 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from src.gui.pyqt_main import PyQtMainWindow, QApplication
+from src.gui.pyqt_main import PyQtMainWindow, QApplication, apply_dark_theme
 
 def main():
     """Main entry point"""
     # Create QApplication instance
     app = QApplication(sys.argv)
+    apply_dark_theme(app)
     
     # Create main window
     window = PyQtMainWindow()
@@ -6,8 +6,11 @@ Shows a visual cursor on the desktop that follows hand movements
 import tkinter as tk
 from typing import Tuple, Optional
 import threading
+import queue
 import time
 
+from src.utils.native_cursor import CursorMover
+
 class CursorOverlay:
     """Desktop cursor overlay that shows hand position"""
     
@@ -19,6 +22,11 @@ class CursorOverlay:
         self.is_clicking = False
         self.update_thread = None
         
+        # Single-slot queue - callers never wait on the Tk thread, stale states are dropped
+        self.update_q = queue.Queue(maxsize=1)
+        self._inner_id = None
+        self._drawn_clicking = False
+        
     def start(self):
         """Start the cursor overlay"""
         if self.running:
@@ -43,10 +51,24 @@ class CursorOverlay:
     def update_position(self, x: int, y: int):
         """Update cursor position"""
         self.current_pos = (x, y)
+        self._post_state()
     
     def set_clicking(self, clicking: bool):
         """Set clicking state (changes cursor appearance)"""
-        self.is_clicking = clicking
+        if clicking != self.is_clicking:
+            self.is_clicking = clicking
+            self._post_state()
+    
+    def _post_state(self):
+        """Hand the current state to the Tk thread, replacing any state it has not drawn yet"""
+        try:
+            self.update_q.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            self.update_q.put_nowait((self.current_pos, self.is_clicking))
+        except queue.Full:
+            pass  # Another caller won the slot - equally fresh
     
     def _create_overlay(self):
         """Create the overlay window"""
@@ -76,45 +98,17 @@ class CursorOverlay:
             )
             canvas.pack()
             
-            # Start update loop
-            self._update_overlay(canvas)
-            
-            # Start tkinter main loop
-            self.overlay_window.mainloop()
-            
-        except Exception as e:
-            print(f"Error creating overlay: {e}")
-    
-    def _update_overlay(self, canvas):
-        """Update overlay appearance and position"""
-        if not self.running:
-            return
-        
-        try:
-            # Clear canvas
-            canvas.delete("all")
-            
-            # Choose cursor color based on state
-            cursor_color = "red" if self.is_clicking else "lime"
-            outline_color = "white"
-            
-            # Draw cursor (circle with crosshair)
+            # Draw cursor once (circle with crosshair) - updates only recolor and move it
             center = self.cursor_size // 2
-            radius = center - 2
-            
-            # Draw outer circle
+            outline_color = "white"
             canvas.create_oval(
                 2, 2, self.cursor_size - 2, self.cursor_size - 2,
                 outline=outline_color, width=2, fill=""
             )
-            
-            # Draw inner circle
-            canvas.create_oval(
+            self._inner_id = canvas.create_oval(
                 center - 3, center - 3, center + 3, center + 3,
-                fill=cursor_color, outline=outline_color
+                fill="lime", outline=outline_color
             )
-            
-            # Draw crosshair
             canvas.create_line(
                 center - 8, center, center + 8, center,
                 fill=outline_color, width=1
@@ -123,21 +117,39 @@ class CursorOverlay:
                 center, center - 8, center, center + 8,
                 fill=outline_color, width=1
             )
+            self._drawn_clicking = False
+            
+            # Start update loop
+            self._update_overlay(canvas)
+            
+            # Start tkinter main loop
+            self.overlay_window.mainloop()
+            
+        except Exception as e:
+            print(f"Error creating overlay: {e}")
+    
+    def _update_overlay(self, canvas):
+        """Apply the newest queued cursor state at the overlay's redraw rate"""
+        if not self.running or self.overlay_window is None:
+            return
+        
+        try:
+            (x, y), clicking = self.update_q.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            # Recolor only when the click state flips
+            if clicking != self._drawn_clicking:
+                canvas.itemconfigure(self._inner_id, fill="red" if clicking else "lime")
+                self._drawn_clicking = clicking
             
-            # Update window position
-            x, y = self.current_pos
             # Offset so cursor center is at the position
             x -= self.cursor_size // 2
             y -= self.cursor_size // 2
-            
             self.overlay_window.geometry(f"{self.cursor_size}x{self.cursor_size}+{x}+{y}")
-            
-            # Schedule next update
-            self.overlay_window.after(16, lambda: self._update_overlay(canvas))  # ~60 FPS
-            
-        except Exception as e:
-            if self.running:  # Only print error if we're supposed to be running
-                print(f"Error updating overlay: {e}")
+        
+        # Schedule next update
+        self.overlay_window.after(33, lambda: self._update_overlay(canvas))  # ~30 FPS
 
 class SimpleCursorOverlay:
     """Simplified cursor overlay using just mouse tracking"""
@@ -145,28 +157,30 @@ class SimpleCursorOverlay:
     def __init__(self):
         self.active = False
         self.click_indicator_time = 0
+        self.cursor = CursorMover()  # Moves the system mouse on its own thread
         
     def start(self):
         """Start the cursor overlay (simplified - just tracks mouse)"""
+        self.cursor.start()
         self.active = True
         print("Cursor overlay started (following system mouse)")
     
     def stop(self):
         """Stop the cursor overlay"""
         self.active = False
+        self.cursor.stop()
         print("Cursor overlay stopped")
     
     def update_position(self, x: int, y: int):
         """Update cursor position (moves system mouse)"""
         if self.active:
-            import pyautogui
-            pyautogui.moveTo(x, y)
+            self.cursor.move_to(x, y)  # Never blocks - the mover thread coalesces to the newest target
     
     def set_clicking(self, clicking: bool):
         """Set clicking state"""
         if clicking:
-            current_time = time.time()
+            now_ns = time.monotonic_ns()
             # Prevent rapid clicking
-            if current_time - self.click_indicator_time > 0.5:
+            if now_ns - self.click_indicator_time > 500_000_000:  # 0.5 s
                 print("CLICK!")
-                self.click_indicator_time = current_time
\ No newline at end of file
+                self.click_indicator_time = now_ns
\ No newline at end of file
@@ -5,6 +5,7 @@ Hand skeleton overlay that appears above all applications
 import cv2
 import numpy as np
 import threading
+import queue
 import time
 from PyQt6.QtWidgets import QWidget, QApplication
 from PyQt6.QtCore import QTimer, Qt, pyqtSignal
@@ -18,6 +19,10 @@ pyautogui.FAILSAFE = False
 
 from src.gesture.gesture_recognizer import GestureRecognizer
 from src.gesture.mouse_controller import MouseController
+from src.utils.camera_stream import to_numpy, to_umat
+
+# MediaPipe input size (16:9 like the 640x360 capture) - landmarks are normalized
+INFERENCE_SIZE = (480, 270)
 
 
 class HandOverlayWidget(QWidget):
@@ -40,38 +45,36 @@ class HandOverlayWidget(QWidget):
         # Set to full screen
         self.setGeometry(0, 0, self.screen_width, self.screen_height)
         
-    def update_landmarks(self, landmarks: Optional[List[List[float]]]):
-        """Update hand landmarks and trigger repaint"""
+        # Pre-built pens for skeleton lines and landmark dots
+        self._skeleton_pen = QPen(QColor(0, 255, 0, 200))  # Green with transparency
+        self._skeleton_pen.setWidth(3)
+        self._landmark_pen = QPen(QColor(255, 0, 0, 200))  # Red dots
+        self._landmark_pen.setWidth(6)
+        
+    def update_landmarks(self, landmarks: Optional[np.ndarray]):
+        """Update hand landmarks (21x3 array) and trigger repaint"""
         self.hand_landmarks = landmarks
         self.update()
         
     def paintEvent(self, event):
         """Draw hand skeleton on overlay"""
-        if not self.hand_landmarks:
+        if self.hand_landmarks is None:
             return
             
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         # Set up pen for drawing
-        pen = QPen(QColor(0, 255, 0, 200))  # Green with transparency
-        pen.setWidth(3)
-        painter.setPen(pen)
+        painter.setPen(self._skeleton_pen)
         
-        # Convert normalized landmarks to screen coordinates
-        screen_landmarks = []
-        for point in self.hand_landmarks:
-            x = int(point[0] * self.screen_width)
-            y = int(point[1] * self.screen_height)
-            screen_landmarks.append((x, y))
+        # Convert normalized landmarks to screen coordinates in one NumPy op
+        screen_landmarks = (self.hand_landmarks[:, :2] * (self.screen_width, self.screen_height)).astype(np.int32).tolist()
         
         # Draw hand connections
         self.draw_hand_connections(painter, screen_landmarks)
         
         # Draw landmarks as dots
-        dot_pen = QPen(QColor(255, 0, 0, 200))  # Red dots
-        dot_pen.setWidth(6)
-        painter.setPen(dot_pen)
+        painter.setPen(self._landmark_pen)
         
         for x, y in screen_landmarks:
             painter.drawPoint(x, y)
@@ -109,7 +112,13 @@ class HandOverlay:
         self.overlay_widget = HandOverlayWidget()
         self.cap = None
         self.is_tracking = False
-        self.tracking_thread = None
+        
+        # Pipeline: reader thread -> read_q -> inference (Qt timer) -> write_q -> mouse writer thread
+        # Single-slot queues that drop the oldest item keep latency low
+        self.read_q = queue.Queue(maxsize=1)
+        self.write_q = queue.Queue(maxsize=1)
+        self.reader_thread = None
+        self.writer_thread = None
         
         # Timer for updating overlay
         self.timer = QTimer()
@@ -121,12 +130,20 @@ class HandOverlay:
             return
             
         self.cap = cv2.VideoCapture(0)
-        # Set high resolution for better accuracy
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Driver drops queued frames instead of serving stale ones
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        # Inference runs at 480x270 and the frame is never shown - capture just above that
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 360)
         self.cap.set(cv2.CAP_PROP_FPS, 60)
         
+        self.mouse_controller.reset_smoothing()  # Don't glide in from the last session's position
         self.is_tracking = True
+        self.reader_thread = threading.Thread(target=self.reader_loop, daemon=True)
+        self.reader_thread.start()
+        self.writer_thread = threading.Thread(target=self.writer_loop, daemon=True)
+        self.writer_thread.start()
+        
         self.overlay_widget.show()
         self.timer.start(16)  # ~60 FPS for better responsiveness
         
@@ -135,47 +152,84 @@ class HandOverlay:
         self.is_tracking = False
         self.timer.stop()
         
+        for thread in (self.reader_thread, self.writer_thread):
+            if thread:
+                thread.join(timeout=1.0)
+        self.reader_thread = None
+        self.writer_thread = None
+        
         if self.cap:
             self.cap.release()
             self.cap = None
             
         self.overlay_widget.hide()
         
+    @staticmethod
+    def _put_latest(q: queue.Queue, item):
+        """Put into a single-slot queue, replacing whatever is still waiting there"""
+        try:
+            q.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            q.put_nowait(item)
+        except queue.Full:
+            pass  # Another producer won the slot - equally fresh
+        
+    def reader_loop(self):
+        """Stage 1 (thread): capture, downscale and mirror frames"""
+        while self.is_tracking:
+            # This thread only captures, so it never falls behind the driver's buffer
+            ret, frame = self.cap.read()
+            if not ret:
+                continue
+                
+            # Downscale for inference (overlay never displays the frame), then flip for mirror effect
+            small_frame = cv2.resize(to_umat(frame), INFERENCE_SIZE, interpolation=cv2.INTER_AREA)
+            self._put_latest(self.read_q, to_numpy(cv2.flip(small_frame, 1)))
+        
     def process_frame(self):
-        """Process camera frame and update overlay"""
-        if not self.is_tracking or not self.cap:
+        """Stage 2 (Qt timer): run gesture recognition on the newest frame and update overlay"""
+        if not self.is_tracking:
             return
             
-        ret, frame = self.cap.read()
-        if not ret:
+        try:
+            frame = self.read_q.get_nowait()
+        except queue.Empty:
             return
-            
-        # Flip frame horizontally for mirror effect
-        frame = cv2.flip(frame, 1)
         
         # Process frame with gesture recognizer
         processed_frame, gesture_data = self.gesture_recognizer.process_frame(frame)
         
         if gesture_data and gesture_data['landmarks'] is not None:
             # Update overlay with landmarks
-            landmarks = gesture_data['landmarks'].tolist()
-            self.overlay_widget.update_landmarks(landmarks)
+            self.overlay_widget.update_landmarks(gesture_data['landmarks'])
             
             # Get mouse position from thumb
             mouse_pos = self.gesture_recognizer.get_mouse_position(gesture_data['landmarks'], frame.shape[:2])
             
+            # Mouse moves and gesture actions run on the writer thread
+            self._put_latest(self.write_q, (gesture_data, mouse_pos))
+        else:
+            # Clear overlay if no hand detected
+            self.overlay_widget.update_landmarks(None)
+            # End any ongoing gestures
+            self._put_latest(self.write_q, (None, None))
+            
+    def writer_loop(self):
+        """Stage 3 (thread): apply cursor moves and gesture actions"""
+        while self.is_tracking:
+            try:
+                gesture_data, mouse_pos = self.write_q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+                
             # Always move cursor to thumb position regardless of gesture
             if mouse_pos:
                 self.mouse_controller.move_mouse(mouse_pos)
             
-            
             # Process gesture with mouse controller
             self.mouse_controller.process_gesture(gesture_data, mouse_pos)
-        else:
-            # Clear overlay if no hand detected
-            self.overlay_widget.update_landmarks(None)
-            # End any ongoing gestures
-            self.mouse_controller.process_gesture(None, None)
             
     def handle_gesture(self, gesture_data):
         """Handle detected gestures (deprecated - now handled by mouse_controller)"""
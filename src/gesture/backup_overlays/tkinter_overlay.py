@@ -5,24 +5,68 @@ Tkinter-based system overlay that works better on macOS
 import tkinter as tk
 import threading
 import time
-import cv2
+import numpy as np
 import platform
 import subprocess
+from functools import lru_cache
 from typing import Optional, List
 from src.gesture.thumb_gesture_recognizer import ThumbGestureRecognizer
-import pyautogui
+from src.utils.camera_stream import CameraBroadcaster
+from src.utils.native_cursor import CursorMover
+
+# MediaPipe input size - landmarks are normalized, so no coordinate adjustment is needed
+INFERENCE_SIZE = (320, 240)
+# How often the Tk thread checks for a pending redraw (~60 Hz)
+REDRAW_POLL_MS = 16
+
+
+@lru_cache(maxsize=1)
+def _get_pyautogui():
+    """Import pyautogui on first use - it is slow to import and only needed once tracking starts"""
+    import pyautogui
+    return pyautogui
 
 
 class TkinterSystemOverlay:
     """System-wide overlay using tkinter - works better on macOS"""
     
+    # Hand connections as polyline chains - one canvas line per finger plus the palm
+    FINGER_CHAINS = (
+        # Thumb
+        (0, 1, 2, 3, 4),
+        # Index finger
+        (0, 5, 6, 7, 8),
+        # Middle finger
+        (0, 9, 10, 11, 12),
+        # Ring finger
+        (0, 13, 14, 15, 16),
+        # Pinky
+        (0, 17, 18, 19, 20),
+        # Palm
+        (5, 9, 13, 17)
+    )
+    # Same chains as int8 index arrays for vectorized landmark lookup (21 landmarks always)
+    CHAIN_IDX = tuple(np.array(chain, dtype=np.int8) for chain in FINGER_CHAINS)
+    
     def __init__(self):
         self.gesture_recognizer = ThumbGestureRecognizer()
-        self.cap = None
+        self.screen_width = self.screen_height = None  # Queried once in start_tracking
+        self.camera = None
+        self.cursor = CursorMover()  # Cursor moves run off the inference thread
         self.is_tracking = False
         self.root = None
         self.canvas = None
         self.landmarks = None
+        self.skeleton_coords = None  # Canvas-ready (line_coords, point_boxes) for the current landmarks
+        self._landmarks_key = None  # Quantized landmark bytes of the last update
+        self._dirty = False  # Set by workers when the skeleton changed; cleared by the Tk thread
+        
+        # Persistent canvas item IDs (created once, moved every frame)
+        self.finger_line_ids = []
+        self.point_ids = []
+        # Canvas size cached from <Configure> (seeded with the screen size in setup_overlay)
+        self._cw = self._ch = None
+        self.canvas_scale = None
         
     def setup_overlay(self):
         """Setup tkinter overlay window"""
@@ -62,21 +106,56 @@ class TkinterSystemOverlay:
             highlightthickness=0
         )
         self.canvas.pack(fill=tk.BOTH, expand=True)
+        self._cw, self._ch = screen_width, screen_height
+        self.canvas_scale = np.array([self._cw, self._ch], dtype=np.float32)
+        self.canvas.bind("<Configure>", self.on_canvas_configure)
+        
+        # Create skeleton items once; draw_hand_skeleton only updates their coordinates
+        self.finger_line_ids = [
+            self.canvas.create_line(0, 0, 0, 0, fill="lime", width=3, state=tk.HIDDEN, tags="skeleton")
+            for _ in self.FINGER_CHAINS
+        ]
+        self.point_ids = [
+            self.canvas.create_oval(0, 0, 0, 0, fill="red", outline="red", state=tk.HIDDEN, tags="skeleton")
+            for _ in range(21)
+        ]
         
         print("✅ Tkinter system overlay created")
         
+    def on_canvas_configure(self, event):
+        """Cache canvas size used to scale landmarks to pixels"""
+        if (event.width, event.height) == (self._cw, self._ch):
+            return
+        self._cw, self._ch = event.width, event.height
+        self.canvas_scale = np.array([self._cw, self._ch], dtype=np.float32)
+        
     def start_tracking(self):
-        """Start hand tracking with overlay"""
+        """Start hand tracking with overlay
+        
+        Runs the Tk event loop on the calling thread (should be the main thread) and
+        returns once stop_tracking() closes the overlay.
+        """
         if self.is_tracking:
             return
             
+        # Query display metrics once
+        self.screen_width, self.screen_height = _get_pyautogui().size()
+        
         # Setup overlay window
         self.setup_overlay()
         
-        # Setup camera
-        self.cap = cv2.VideoCapture(0)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
+        # Run MediaPipe in LIVE_STREAM mode when available - results arrive in on_gesture_result
+        self.gesture_recognizer.start_live_stream(self.on_gesture_result)
+        
+        # Setup camera - frames are captured in a separate process and shared via shared memory
+        self.camera = CameraBroadcaster(0, 640, 480, fourcc='YUYV').start()
+        self.cursor.start()
+        
+        # Fresh canvas items - force the first skeleton to be drawn
+        self.landmarks = None
+        self.skeleton_coords = None
+        self._landmarks_key = None
+        self._dirty = False
         
         self.is_tracking = True
         
@@ -84,120 +163,123 @@ class TkinterSystemOverlay:
         self.processing_thread = threading.Thread(target=self.processing_loop, daemon=True)
         self.processing_thread.start()
         
-        # Start tkinter main loop in separate thread  
-        self.gui_thread = threading.Thread(target=self.gui_loop, daemon=True)
-        self.gui_thread.start()
-        
         print("🎯 Tkinter overlay started - should be visible above all apps")
         
+        # Tk is not thread-safe - workers only set _dirty, this thread polls it and does all Tk calls
+        self.root.after(REDRAW_POLL_MS, self._poll_redraw)
+        self.root.mainloop()
+        self.root = None
+        self.canvas = None
+        
     def stop_tracking(self):
         """Stop hand tracking"""
         self.is_tracking = False
         
-        if self.cap:
-            self.cap.release()
-            self.cap = None
+        if self.camera:
+            self.camera.stop()
+            self.camera = None
             
-        if self.root:
-            self.root.after(0, self.root.destroy)
-            
-    def gui_loop(self):
-        """Run tkinter GUI loop"""
-        if self.root:
-            # Update overlay every 33ms (~30 FPS)
-            self.root.after(33, self.update_overlay)
-            self.root.mainloop()
+        self.cursor.stop()
+        # _poll_redraw sees is_tracking cleared and destroys the window on the Tk thread
             
     def processing_loop(self):
         """Process camera frames"""
-        while self.is_tracking and self.cap:
-            ret, frame = self.cap.read()
-            if not ret:
+        import cv2  # Deferred - not needed until tracking starts
+        
+        camera = self.camera
+        while self.is_tracking:
+            # Wait for the next frame (timeout so stop_tracking is noticed)
+            frame = camera.read(timeout=0.1)
+            if frame is None:
                 continue
                 
-            # Flip frame horizontally for mirror effect
-            frame = cv2.flip(frame, 1)
+            # Downscale for inference (overlay never displays the frame), then flip for mirror effect
+            small_frame = cv2.resize(frame, INFERENCE_SIZE, interpolation=cv2.INTER_AREA)
+            small_frame = cv2.flip(small_frame, 1)
             
-            # Process frame with gesture recognizer
-            processed_frame, gesture_data = self.gesture_recognizer.process_frame(frame)
+            # Submit frame to gesture recognizer (timestamps must increase monotonically)
+            self.gesture_recognizer.process_frame_async(small_frame, time.monotonic_ns() // 1_000_000)
             
-            if gesture_data and gesture_data['landmarks'] is not None:
-                self.landmarks = gesture_data['landmarks'].tolist()
-                
-                # Handle gestures
-                self.handle_gesture(gesture_data)
-            else:
-                self.landmarks = None
-                
-            time.sleep(0.033)  # ~30 FPS
+    def on_gesture_result(self, gesture_data):
+        """Handle recognizer output (called from MediaPipe's result thread in LIVE_STREAM mode)"""
+        if not self.is_tracking:
+            return
+            
+        if gesture_data and gesture_data['landmarks'] is not None:
+            landmarks = gesture_data['landmarks']
+            
+            # Only redraw when the hand actually moved (quantized to ~0.1% of the screen)
+            key = landmarks[:, :2].round(3).tobytes()
+            if key != self._landmarks_key:
+                self._landmarks_key = key
+                self.landmarks = landmarks
+                # Pixel conversion happens here so the Tk thread only issues canvas calls
+                self.skeleton_coords = self.to_canvas_coords(landmarks)
+                self.request_redraw()
+            
+            # Handle gestures
+            self.handle_gesture(gesture_data)
+        elif self.landmarks is not None:
+            self.landmarks = None
+            self.skeleton_coords = None
+            self._landmarks_key = None
+            self.request_redraw()  # Hide the skeleton once
+            
+    def request_redraw(self):
+        """Mark the overlay for redraw - safe from any thread, makes no Tk calls"""
+        self._dirty = True
+        
+    def _poll_redraw(self):
+        """Tk-thread loop: apply pending redraws, close the window once tracking stops"""
+        if not self.is_tracking:
+            self.root.destroy()
+            return
+        if self._dirty:
+            self.update_overlay()
+        self.root.after(REDRAW_POLL_MS, self._poll_redraw)
             
     def update_overlay(self):
-        """Update overlay display"""
+        """Update overlay display (runs on the Tk thread, called from _poll_redraw)"""
+        self._dirty = False
         if not self.is_tracking or not self.canvas:
             return
             
-        # Clear canvas
-        self.canvas.delete("all")
-        
-        if self.landmarks:
+        if self.skeleton_coords is not None:
             self.draw_hand_skeleton()
+        else:
+            # Hide skeleton items instead of deleting them
+            self.canvas.itemconfigure("skeleton", state=tk.HIDDEN)
             
-        # Keep window on top
-        self.root.lift()
+    def to_canvas_coords(self, landmarks: np.ndarray):
+        """Convert normalized landmarks to canvas-ready Python int coordinates"""
+        # Integer screen coordinates in one NumPy op
+        pts = np.rint(landmarks[:, :2] * self.canvas_scale).astype(np.int32)
         
-        # Schedule next update
-        if self.is_tracking:
-            self.root.after(33, self.update_overlay)
+        # Finger polylines - each chain flattened to x0, y0, x1, y1, ...
+        line_coords = [pts[chain].ravel().tolist() for chain in self.CHAIN_IDX]
+        
+        # Landmark point bounding boxes - x0, y0, x1, y1 rows
+        point_boxes = np.hstack((pts - 4, pts + 4)).tolist()
+        
+        return line_coords, point_boxes
             
     def draw_hand_skeleton(self):
         """Draw hand skeleton on canvas"""
-        if not self.landmarks or not self.canvas:
+        skeleton_coords = self.skeleton_coords  # Local ref - the result thread may replace it
+        if skeleton_coords is None or not self.canvas:
             return
             
-        screen_width = self.canvas.winfo_width()
-        screen_height = self.canvas.winfo_height()
-        
-        # Convert normalized landmarks to screen coordinates
-        screen_landmarks = []
-        for point in self.landmarks:
-            x = int(point[0] * screen_width)
-            y = int(point[1] * screen_height)
-            screen_landmarks.append((x, y))
-        
-        # Hand connections
-        connections = [
-            # Thumb
-            (0, 1), (1, 2), (2, 3), (3, 4),
-            # Index finger
-            (0, 5), (5, 6), (6, 7), (7, 8),
-            # Middle finger  
-            (0, 9), (9, 10), (10, 11), (11, 12),
-            # Ring finger
-            (0, 13), (13, 14), (14, 15), (15, 16),
-            # Pinky
-            (0, 17), (17, 18), (18, 19), (19, 20),
-            # Palm
-            (5, 9), (9, 13), (13, 17)
-        ]
+        line_coords, point_boxes = skeleton_coords
         
-        # Draw connections
-        for start_idx, end_idx in connections:
-            if start_idx < len(screen_landmarks) and end_idx < len(screen_landmarks):
-                start_point = screen_landmarks[start_idx]
-                end_point = screen_landmarks[end_idx]
-                
-                self.canvas.create_line(
-                    start_point[0], start_point[1],
-                    end_point[0], end_point[1],
-                    fill="lime", width=3
-                )
-        
-        # Draw landmark points
-        for x, y in screen_landmarks:
-            self.canvas.create_oval(
-                x-4, y-4, x+4, y+4,
-                fill="red", outline="red"
-            )
+        # Move finger polylines
+        for line_id, coords in zip(self.finger_line_ids, line_coords):
+            self.canvas.coords(line_id, *coords)
+        
+        # Move landmark points
+        for point_id, box in zip(self.point_ids, point_boxes):
+            self.canvas.coords(point_id, *box)
+        
+        self.canvas.itemconfigure("skeleton", state=tk.NORMAL)
             
     def handle_gesture(self, gesture_data):
         """Handle detected gestures"""
@@ -208,15 +290,16 @@ class TkinterSystemOverlay:
             # Move cursor based on thumb position
             thumb_pos = self.gesture_recognizer.get_thumb_position(landmarks)
             if thumb_pos:
-                screen_x = int(thumb_pos[0] * pyautogui.size()[0])
-                screen_y = int(thumb_pos[1] * pyautogui.size()[1])
-                pyautogui.moveTo(screen_x, screen_y, duration=0.02)
+                screen_x = int(thumb_pos[0] * self.screen_width)
+                screen_y = int(thumb_pos[1] * self.screen_height)
+                # Hand off to the cursor thread - only the latest target is applied
+                self.cursor.move_to(screen_x, screen_y)
             
         elif gesture_type == "thumb_index_click":
-            pyautogui.click()
+            _get_pyautogui().click()
             
         elif gesture_type == "thumb_index_double_click":
-            pyautogui.doubleClick()
+            _get_pyautogui().doubleClick()
 
 
 def create_tkinter_overlay():
@@ -58,12 +58,12 @@ class GestureRecognizer:
     
     def _extract_gesture(self, landmarks) -> Dict:
         """Extract gesture type from hand landmarks"""
-        # Get landmark positions
-        positions = []
-        for lm in landmarks.landmark:
-            positions.append([lm.x, lm.y, lm.z])
-        
-        positions = np.array(positions)
+        # Get landmark positions as a (21, 3) array once - every helper indexes into it
+        positions = np.fromiter(
+            (v for lm in landmarks.landmark for v in (lm.x, lm.y, lm.z)),
+            dtype=np.float32,
+            count=len(landmarks.landmark) * 3
+        ).reshape(-1, 3)
         
         # Detect specific gestures
         gesture_type = self._classify_gesture(positions)
@@ -88,26 +88,20 @@ class GestureRecognizer:
         PINKY_TIP = 20
         PINKY_PIP = 18
         
-        thumb_pos = positions[THUMB_TIP]
-        index_pos = positions[INDEX_TIP]
-        middle_pos = positions[MIDDLE_TIP]
+        # Thumb-index, thumb-middle and index-middle tip distances in one vectorized op
+        tips = positions[[THUMB_TIP, THUMB_TIP, INDEX_TIP]] - positions[[INDEX_TIP, MIDDLE_TIP, MIDDLE_TIP]]
+        thumb_index_dist, thumb_middle_dist, index_middle_dist = np.sqrt(np.einsum('ij,ij->i', tips, tips))
         
         # Check for thumb-index pinch (left click) - more sensitive
-        thumb_index_dist = np.sqrt(np.sum((thumb_pos - index_pos) ** 2))
         if thumb_index_dist < PINCH_THRESHOLD:
             return "thumb_index_pinch"
         
         # Check for thumb-middle pinch (right click) - more sensitive
-        thumb_middle_dist = np.sqrt(np.sum((thumb_pos - middle_pos) ** 2))
         if thumb_middle_dist < PINCH_THRESHOLD:
             return "thumb_middle_pinch"
         
         # Check for thumb-index-middle triple pinch (scroll gesture)
         # All three fingers (thumb, index, middle) must be close together
-        thumb_index_dist = np.sqrt(np.sum((thumb_pos - index_pos) ** 2))
-        thumb_middle_dist = np.sqrt(np.sum((thumb_pos - middle_pos) ** 2))
-        index_middle_dist = np.sqrt(np.sum((index_pos - middle_pos) ** 2))
-        
         # Triple pinch condition: all distances must be below threshold
         triple_pinch_threshold = PINCH_THRESHOLD * 2  # Slightly larger threshold for 3-finger pinch
         if (thumb_index_dist < triple_pinch_threshold and 
@@ -115,15 +109,10 @@ class GestureRecognizer:
             index_middle_dist < triple_pinch_threshold):
             return self._handle_thumb_index_middle_scroll(positions)
         
-        # Get finger states (extended or not)
-        thumb_up = positions[THUMB_TIP][1] < positions[THUMB_IP][1]
-        index_up = positions[INDEX_TIP][1] < positions[INDEX_PIP][1]
-        middle_up = positions[MIDDLE_TIP][1] < positions[MIDDLE_PIP][1]
-        ring_up = positions[RING_TIP][1] < positions[RING_PIP][1]
-        pinky_up = positions[PINKY_TIP][1] < positions[PINKY_PIP][1]
-        
-        fingers_up = [thumb_up, index_up, middle_up, ring_up, pinky_up]
-        total_fingers = sum(fingers_up)
+        # Get finger states (extended or not) - tip above its lower joint
+        fingers_up = (positions[[THUMB_TIP, INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP], 1] <
+                      positions[[THUMB_IP, INDEX_PIP, MIDDLE_PIP, RING_PIP, PINKY_PIP], 1])
+        total_fingers = int(np.count_nonzero(fingers_up))
         
         # Old thumb-only scroll gesture removed - replaced with thumb-ring pinch scroll
         
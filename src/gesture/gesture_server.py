@@ -0,0 +1,241 @@
+"""
+Resident gesture recognizer - keeps the MediaPipe graphs loaded between app runs
+
+Start it once with `python -m src.gesture.gesture_server`, then run the app with
+GESTURE_SERVER=1. Frames travel through shared memory; only the small gesture dicts
+go over the connection.
+
+multiprocessing.connection pickles every message, so the endpoint is private to the
+user: a Unix socket in a 0700 directory (a per-user named pipe on Windows) plus a
+random authkey, regenerated at every server start and stored in a 0600 file.
+"""
+
+import os
+import getpass
+import queue
+import secrets
+import tempfile
+import threading
+import numpy as np
+from multiprocessing import shared_memory
+from multiprocessing.connection import AuthenticationError, Client, Listener
+from typing import Dict, Optional, Tuple
+
+from config.settings import GESTURE_SERVER_CONNECT_TIMEOUT
+
+
+def _runtime_dir() -> str:
+    """Per-user directory for the socket and key - refuses one other users can reach"""
+    base = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    path = os.path.join(base, f"gesture-server-{getpass.getuser()}")
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    
+    if os.name == "posix":
+        st = os.lstat(path)
+        if st.st_uid != os.getuid() or st.st_mode & 0o077 or not os.path.isdir(path):
+            raise PermissionError(f"Gesture server directory {path} is not private to this user")
+    return path
+
+
+def _server_address() -> str:
+    """Unix socket path (POSIX) or per-user named pipe (Windows)"""
+    if os.name == "nt":
+        return rf"\\.\pipe\gesture-server-{getpass.getuser()}"
+    return os.path.join(_runtime_dir(), "server.sock")
+
+
+def _key_path() -> str:
+    return os.path.join(_runtime_dir(), "server.key")
+
+
+def _create_authkey() -> bytes:
+    """Generate a fresh authkey and publish it to a 0600 file (atomically replaced)"""
+    authkey = secrets.token_bytes(32)
+    key_path = _key_path()
+    tmp_path = f"{key_path}.{os.getpid()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(authkey)
+    os.replace(tmp_path, key_path)
+    return authkey
+
+
+def _read_authkey() -> Optional[bytes]:
+    """Authkey of the running server (None if no server has published one)"""
+    try:
+        with open(_key_path(), "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to a client-owned segment without letting this process's tracker unlink it"""
+    shm = shared_memory.SharedMemory(name=name)
+    if os.name == "posix":
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def _serve_client(conn, recognizer):
+    """Answer one client's requests until it disconnects"""
+    shm = None
+    frame = None
+    recognizer.set_model_complexity(1)  # Clients start from the default model
+    recognizer.reset_gesture_state()  # Previous client may have left mid-drag
+    try:
+        while True:
+            try:
+                message = conn.recv()
+            except EOFError:
+                break
+            
+            kind = message[0]
+            if kind == "frame":
+                if frame is None:
+                    conn.send(None)  # Frame before attach - nothing to read
+                    continue
+                _, gesture_data = recognizer.process_frame(frame)
+                conn.send(gesture_data)
+            elif kind == "attach":
+                # New frame size - the client created a fresh segment
+                _, shm_name, shape = message
+                frame = None
+                if shm:
+                    shm.close()
+                shm = _attach_shared_memory(shm_name)
+                frame = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+            elif kind == "complexity":
+                recognizer.set_model_complexity(message[1])
+    finally:
+        frame = None
+        if shm:
+            shm.close()
+        conn.close()
+
+
+def serve(recognizer=None):
+    """Load the recognizer once and serve clients one at a time (recognizer: override for tests)"""
+    if recognizer is None:
+        from src.gesture.thumb_gesture_recognizer import ThumbGestureRecognizer
+        recognizer = ThumbGestureRecognizer()  # The cold start clients get to skip
+    address = _server_address()
+    authkey = _create_authkey()
+    if os.name == "posix" and os.path.exists(address):
+        os.unlink(address)  # Stale socket from a previous run - the directory is ours
+    
+    with Listener(address, authkey=authkey) as listener:
+        print(f"Gesture server listening on {address}")
+        try:
+            while True:
+                try:
+                    conn = listener.accept()
+                except (AuthenticationError, EOFError, OSError):
+                    continue  # Failed handshake or client gone before it finished
+                try:
+                    _serve_client(conn, recognizer)
+                except (OSError, EOFError, ValueError, TypeError) as e:
+                    # Reset/broken pipe or a malformed attach - drop this client, keep serving
+                    print(f"Gesture server client dropped: {e}")
+        except KeyboardInterrupt:
+            pass
+        finally:
+            recognizer.cleanup()
+
+
+class GestureServerClient:
+    """Stands in for ThumbGestureRecognizer, running inference in the gesture server"""
+    
+    def __init__(self, conn):
+        self.conn = conn
+        self.model_complexity = 1
+        self.shm = None
+        self._frame = None
+    
+    @classmethod
+    def connect(cls, timeout: float = GESTURE_SERVER_CONNECT_TIMEOUT) -> Optional["GestureServerClient"]:
+        """Connect to a running server (None if there isn't one or it stays busy past timeout)
+        
+        Client() has no timeout and blocks in the handshake while the server is serving
+        someone else, so the attempt runs on a daemon thread.
+        """
+        try:
+            address = _server_address()
+        except OSError:
+            return None
+        authkey = _read_authkey()
+        if authkey is None:
+            return None
+        
+        result = queue.Queue()
+        lock = threading.Lock()
+        abandoned = False
+        
+        def attempt():
+            try:
+                # The authkey handshake is mutual - a process squatting on the address can't pass it
+                conn = Client(address, authkey=authkey)
+            except (OSError, EOFError, AuthenticationError):
+                conn = None
+            with lock:
+                if abandoned and conn is not None:
+                    conn.close()  # Caller already fell back to the local recognizer
+                else:
+                    result.put(conn)
+        
+        threading.Thread(target=attempt, daemon=True).start()
+        try:
+            conn = result.get(timeout=timeout)
+        except queue.Empty:
+            with lock:
+                abandoned = True
+                conn = result.get_nowait() if not result.empty() else None
+            if conn is not None:
+                conn.close()
+            return None
+        return cls(conn) if conn is not None else None
+    
+    def _attach(self, shape: Tuple[int, ...]):
+        """Create a shared frame buffer for this frame size and announce it"""
+        self._release_shared_memory()
+        self.shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)))
+        self._frame = np.ndarray(shape, dtype=np.uint8, buffer=self.shm.buf)
+        self.conn.send(("attach", self.shm.name, shape))
+    
+    def process_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, Optional[Dict]]:
+        """Same contract as ThumbGestureRecognizer.process_frame"""
+        if self._frame is None or self._frame.shape != frame.shape:
+            self._attach(frame.shape)
+        np.copyto(self._frame, frame)
+        self.conn.send(("frame",))
+        return frame, self.conn.recv()
+    
+    def set_model_complexity(self, model_complexity: int):
+        """Switch the server's Hands landmark model (0 = lite, 1 = full)"""
+        if model_complexity == self.model_complexity:
+            return
+        self.conn.send(("complexity", model_complexity))
+        self.model_complexity = model_complexity
+    
+    def get_thumb_position(self, landmarks: np.ndarray) -> Tuple[float, float]:
+        """Get normalized thumb position for cursor control"""
+        if landmarks is None:
+            return None
+        return landmarks[4][0], landmarks[4][1]
+    
+    def _release_shared_memory(self):
+        self._frame = None
+        if self.shm:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+    
+    def cleanup(self):
+        """Disconnect and free the shared frame buffer"""
+        self.conn.close()
+        self._release_shared_memory()
+
+
+if __name__ == "__main__":
+    serve()
@@ -6,6 +6,8 @@ import pyautogui
 import time
 from typing import Optional, Tuple
 from config.settings import *
+from src.utils.native_cursor import get_move_cursor
+from src.utils.one_euro_filter import OneEuroFilter
 # Import specific settings if needed  
 try:
     from config.settings import (CLICK_HOLD_TIME, SCROLL_SENSITIVITY, MOUSE_SENSITIVITY, 
@@ -18,6 +20,11 @@ except ImportError:
     PINCH_THRESHOLD = 0.04
     SCROLL_ANGLE_THRESHOLD = 0.15
 
+# Click timing thresholds as time.monotonic_ns() deltas
+CLICK_HOLD_NS = int(CLICK_HOLD_TIME * 1_000_000_000)
+DOUBLE_CLICK_NS = int(DOUBLE_CLICK_THRESHOLD * 1_000_000_000)
+SHORT_PINCH_NS = 150_000_000  # Less than 150ms = click
+
 class MouseController:
     def __init__(self):
         # Configure pyautogui for maximum responsiveness
@@ -25,6 +32,12 @@ class MouseController:
         pyautogui.PAUSE = 0.001  # Minimal delay for faster response
         
         self.screen_width, self.screen_height = pyautogui.size()
+        self._move_cursor = get_move_cursor()  # Native cursor warp, bound once
+        
+        # Cursor smoothing - removes landmark jitter and the OS calls it would cause
+        self.filter_x = OneEuroFilter(min_cutoff=1.0, beta=0.01)
+        self.filter_y = OneEuroFilter(min_cutoff=1.0, beta=0.01)
+        self.last_cursor = None
         self.mouse_enabled = True
         self.last_click_time = 0
         
@@ -46,6 +59,9 @@ class MouseController:
         
     def process_gesture(self, gesture_data: dict, mouse_pos: Optional[Tuple[int, int]] = None):
         """Process gesture and execute corresponding mouse action"""
+        if not gesture_data:
+            # Hand lost - it may reappear elsewhere, so don't smooth from the old position
+            self.reset_smoothing()
         if not self.mouse_enabled or not gesture_data:
             # End any ongoing pinch drag if no gesture detected
             if self.pinch_dragging:
@@ -89,29 +105,40 @@ class MouseController:
         if not self.mouse_enabled or position is None:
             return
             
-        # Direct mapping from normalized hand coordinates to screen coordinates
+        # Map normalized hand coordinates to screen coordinates, One-Euro filtered
         # position comes as (x, y) where x, y are normalized [0, 1]
-        screen_x = int(position[0] * self.screen_width)
-        screen_y = int(position[1] * self.screen_height)
+        now = time.monotonic()
+        screen_x = round(self.filter_x.filter(position[0] * self.screen_width, now))
+        screen_y = round(self.filter_y.filter(position[1] * self.screen_height, now))
         
         # Ensure coordinates are within screen bounds
         screen_x = max(0, min(screen_x, self.screen_width - 1))
         screen_y = max(0, min(screen_y, self.screen_height - 1))
         
+        # Sub-pixel changes - skip the OS call
+        if (screen_x, screen_y) == self.last_cursor:
+            return
         
-        # Use moveTo with duration=0 for immediate response
-        pyautogui.moveTo(screen_x, screen_y, duration=0)
+        # Direct OS call - skips pyautogui's wrapper layers and PAUSE sleep
+        self._move_cursor(screen_x, screen_y)
+        self.last_cursor = (screen_x, screen_y)
+    
+    def reset_smoothing(self):
+        """Forget the filtered cursor history (hand lost or tracking restarted)"""
+        self.filter_x.reset()
+        self.filter_y.reset()
+        self.last_cursor = None
     
     def handle_left_click_or_drag(self, mouse_pos: Optional[Tuple[int, int]] = None):
         """Handle thumb-index pinch: click or drag"""
         if not self.mouse_enabled:
             return
             
-        current_time = time.time()
+        current_time = time.monotonic_ns()
         
         if not self.pinch_dragging:
             # Check for double-click first
-            if current_time - self.last_click_time < DOUBLE_CLICK_THRESHOLD:
+            if current_time - self.last_click_time < DOUBLE_CLICK_NS:
                 self.double_click()
                 return
             
@@ -127,13 +154,13 @@ class MouseController:
     def end_pinch_drag(self):
         """End pinch drag operation"""
         if self.pinch_dragging:
-            current_time = time.time()
+            current_time = time.monotonic_ns()
             drag_duration = current_time - self.pinch_start_time
             
             pyautogui.mouseUp()
             
             # If drag duration was very short, treat as click
-            if drag_duration < 0.15:  # Less than 150ms = click
+            if drag_duration < SHORT_PINCH_NS:
                 # mouseUp already happened, so this was effectively a click
                 pass
             
@@ -145,8 +172,8 @@ class MouseController:
         if not self.mouse_enabled:
             return
             
-        current_time = time.time()
-        if current_time - self.last_click_time > CLICK_HOLD_TIME:
+        current_time = time.monotonic_ns()
+        if current_time - self.last_click_time > CLICK_HOLD_NS:
             pyautogui.click()
             self.last_click_time = current_time
     
@@ -155,8 +182,8 @@ class MouseController:
         if not self.mouse_enabled:
             return
             
-        current_time = time.time()
-        if current_time - self.last_click_time > CLICK_HOLD_TIME:
+        current_time = time.monotonic_ns()
+        if current_time - self.last_click_time > CLICK_HOLD_NS:
             pyautogui.rightClick()
             self.last_click_time = current_time
     
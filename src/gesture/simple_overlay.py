@@ -2,30 +2,60 @@
 Simple floating window overlay for hand skeleton
 """
 
-import cv2
-import numpy as np
+import math
 import threading
 import time
-from PyQt6.QtWidgets import QWidget, QApplication, QPushButton, QVBoxLayout, QHBoxLayout, QLabel
-from PyQt6.QtCore import QTimer, Qt, pyqtSignal, QObject
-from PyQt6.QtGui import QPainter, QPen, QColor, QFont, QPixmap, QImage
-from typing import Optional, List
-try:
-    import pyautogui
-except ImportError:
-    print("WARNING: pyautogui not installed, mouse control will be disabled")
-    pyautogui = None
+import cv2
+import numpy as np
+from PyQt6.QtWidgets import QWidget, QApplication, QPushButton, QVBoxLayout, QLabel, QStyle, QStyleOption
+from PyQt6.QtCore import QObject, QTimer, Qt, QRect, pyqtSignal
+from PyQt6.QtGui import QPainter, QPen, QColor, QPixmap, QImage
+from typing import Optional
 
+from config.settings import USE_GESTURE_SERVER
+from src.gesture.gesture_server import GestureServerClient
 from src.gesture.thumb_gesture_recognizer import ThumbGestureRecognizer
+from src.utils.camera_stream import FrameReader, dst_buffer, to_numpy, to_umat
+from src.utils.native_cursor import get_move_cursor
+from src.utils.one_euro_filter import OneEuroFilter
+
+# MediaPipe input size - landmarks are normalized, so no coordinate adjustment is needed
+INFERENCE_SIZE = (320, 240)
+
+# Motion gate - skip inference while the scene is static and no hand is in view
+# (a pinch changes too few pixels to trip a whole-frame diff, so a tracked hand bypasses it)
+MOTION_SIZE = (80, 60)
+MOTION_THRESHOLD = 2.0  # Mean absolute grayscale difference
+MOTION_RECHECK_INTERVAL = 5  # Run inference at least every N frames regardless
+
+CAMERA_VIEW_INTERVAL = 3  # Camera feedback window refresh - every Nth frame (~10 FPS)
+
+# Adaptive model complexity - inference time EMA (ms) thresholds
+LITE_MODEL_ABOVE_MS = 45.0  # Full model can't keep up - switch to lite
+FULL_MODEL_BELOW_MS = 20.0  # Lite model has plenty of headroom - switch back to full
+COMPLEXITY_WARMUP_FRAMES = 10  # Samples ignored after a switch (model load, tracker re-detect)
+# The lite/full cost ratio differs per machine - hold each model a while, longer after every
+# lite -> full return, so a machine where full is slow but lite is fast can't flip-flop
+MIN_MODEL_DWELL_S = 10.0
+MAX_MODEL_DWELL_S = 160.0
+
+# While the hand moves, run inference every Nth frame and extrapolate the cursor in between
+INFERENCE_INTERVAL = 2
+MAX_EXTRAPOLATION_PX = 40  # Cap so the cursor doesn't overshoot when the hand stops
 
 
 class HandOverlayWidget(QWidget):
+    # Only index(8) and middle(12) finger tips are drawn
+    FINGERTIP_INDICES = [8, 12]
+    DOT_SIZE = 10  # Fingertip dot diameter in pixels
+    
     def __init__(self):
         super().__init__()
-        self.hand_landmarks = None
+        self.fingertips = None
         self.gesture_data = None
         self.screen_width = QApplication.primaryScreen().size().width()
         self.screen_height = QApplication.primaryScreen().size().height()
+        self.screen_scale = np.array([self.screen_width, self.screen_height], dtype=np.float32)
         
         # Make widget transparent and always on top with highest priority
         self.setWindowFlags(
@@ -43,14 +73,30 @@ class HandOverlayWidget(QWidget):
         # Set to full screen
         self.setGeometry(0, 0, self.screen_width, self.screen_height)
         
+        # Pre-built fingertip pens (avoid per-paint QPen/QColor allocation)
+        self._default_pen = self._make_dot_pen(QColor(128, 128, 128, 200))  # Grey dots
+        self._thumb_index_pen = self._make_dot_pen(QColor(0, 255, 0, 255))  # Bright green for thumb-index interaction
+        self._thumb_middle_pen = self._make_dot_pen(QColor(255, 100, 0, 255))  # Orange for thumb-middle interaction
+        
         # Timer to ensure it stays on top
         self.raise_timer = QTimer()
         self.raise_timer.timeout.connect(self.ensure_on_top)
         self.raise_timer.start(100)  # Check every 100ms
         
-    def update_landmarks(self, landmarks: Optional[List[List[float]]], gesture_data: Optional[dict] = None):
-        """Update hand landmarks and gesture data, trigger repaint"""
-        self.hand_landmarks = landmarks
+    @staticmethod
+    def _make_dot_pen(color: QColor) -> QPen:
+        """Create a fingertip dot pen"""
+        pen = QPen(color)
+        pen.setWidth(HandOverlayWidget.DOT_SIZE)  # Larger dots for visibility
+        return pen
+        
+    def to_fingertips(self, landmarks: np.ndarray) -> np.ndarray:
+        """Convert normalized landmarks to fingertip screen pixels (Nx2 int32, FINGERTIP_INDICES order)"""
+        return (landmarks[self.FINGERTIP_INDICES, :2] * self.screen_scale).astype(np.int32)
+        
+    def update_fingertips(self, fingertips: Optional[np.ndarray], gesture_data: Optional[dict] = None):
+        """Update fingertip pixel coordinates and gesture data, trigger repaint"""
+        self.fingertips = fingertips
         self.gesture_data = gesture_data
         self.update()
         
@@ -61,27 +107,23 @@ class HandOverlayWidget(QWidget):
         
     def paintEvent(self, event):
         """Draw only index and middle fingers with color changes during interactions"""
-        if not self.hand_landmarks:
+        if self.fingertips is None:
+            return
+        
+        # Skip fingertips outside the damaged region; bail out before creating a painter if none remain
+        region = event.region()
+        half = self.DOT_SIZE // 2
+        visible_tips = [
+            (finger_idx, x, y)
+            for finger_idx, (x, y) in zip(self.FINGERTIP_INDICES, self.fingertips.tolist())
+            if region.intersects(QRect(x - half, y - half, self.DOT_SIZE, self.DOT_SIZE))
+        ]
+        if not visible_tips:
             return
             
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Convert normalized landmarks to screen coordinates
-        screen_landmarks = []
-        for point in self.hand_landmarks:
-            x = int(point[0] * self.screen_width)
-            y = int(point[1] * self.screen_height)
-            screen_landmarks.append((x, y))
-        
-        # Only draw index(8) and middle(12) finger tips
-        finger_indices = [8, 12]  # Index, Middle fingertips
-        
-        # Default colors (grey)
-        default_color = QColor(128, 128, 128, 200)  # Grey dots
-        thumb_index_color = QColor(0, 255, 0, 255)  # Bright green for thumb-index interaction
-        thumb_middle_color = QColor(255, 100, 0, 255)  # Orange for thumb-middle interaction
-        
         # Check for thumb interactions
         is_thumb_index_interacting = False
         is_thumb_middle_interacting = False
@@ -102,23 +144,18 @@ class HandOverlayWidget(QWidget):
                     is_thumb_middle_interacting = True
         
         # Draw finger dots with appropriate colors
-        for i, finger_idx in enumerate(finger_indices):
-            if finger_idx < len(screen_landmarks):
-                x, y = screen_landmarks[finger_idx]
-                
-                # Choose color based on interaction
-                if finger_idx == 8 and is_thumb_index_interacting:  # Index finger
-                    color = thumb_index_color
-                elif finger_idx == 12 and is_thumb_middle_interacting:  # Middle finger
-                    color = thumb_middle_color
-                else:
-                    color = default_color
-                
-                # Draw the finger tip
-                dot_pen = QPen(color)
-                dot_pen.setWidth(10)  # Larger dots for visibility
-                painter.setPen(dot_pen)
-                painter.drawPoint(x, y)
+        for finger_idx, x, y in visible_tips:
+            # Choose pen based on interaction
+            if finger_idx == 8 and is_thumb_index_interacting:  # Index finger
+                pen = self._thumb_index_pen
+            elif finger_idx == 12 and is_thumb_middle_interacting:  # Middle finger
+                pen = self._thumb_middle_pen
+            else:
+                pen = self._default_pen
+            
+            # Draw the finger tip
+            painter.setPen(pen)
+            painter.drawPoint(x, y)
     
     def draw_hand_connections(self, painter, landmarks):
         """Draw hand skeleton connections - now disabled for fingertips only mode"""
@@ -129,7 +166,15 @@ class HandOverlayWidget(QWidget):
 class FloatingSkeletonWindow(QWidget):
     def __init__(self):
         super().__init__()
+        self.drag_position = None
         self.hand_landmarks = None
+        
+        # Pre-built pens for skeleton lines and landmark dots
+        self._skeleton_pen = QPen(QColor(0, 255, 0, 200))  # Green
+        self._skeleton_pen.setWidth(2)
+        self._landmark_pen = QPen(QColor(255, 0, 0, 200))  # Red dots
+        self._landmark_pen.setWidth(4)
+        
         self.setup_window()
         
     def setup_window(self):
@@ -148,34 +193,33 @@ class FloatingSkeletonWindow(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
         self.setStyleSheet("background-color: rgba(0, 0, 0, 100);")
         
-    def update_landmarks(self, landmarks: Optional[List[List[float]]]):
-        """Update hand landmarks and trigger repaint"""
+    def update_landmarks(self, landmarks: Optional[np.ndarray]):
+        """Update hand landmarks (21x3 array) and trigger repaint"""
         self.hand_landmarks = landmarks
         self.update()
         
     def paintEvent(self, event):
         """Draw hand skeleton"""
-        if not self.hand_landmarks:
+        if self.hand_landmarks is None:
+            return
+        
+        # Nothing to do for expose events that don't touch the window contents
+        if not event.region().intersects(self.rect()):
             return
             
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        # Scale landmarks to window size
+        # Scale and flip landmarks to fit window (flip X for mirror)
         window_width = self.width()
         window_height = self.height()
         
-        screen_landmarks = []
-        for point in self.hand_landmarks:
-            # Scale and flip landmarks to fit window
-            x = int((1.0 - point[0]) * window_width)  # Flip X for mirror
-            y = int(point[1] * window_height)
-            screen_landmarks.append((x, y))
+        points = self.hand_landmarks[:, :2].copy()
+        points[:, 0] = 1.0 - points[:, 0]
+        screen_landmarks = (points * (window_width, window_height)).astype(np.int32).tolist()
         
         # Draw hand connections
-        pen = QPen(QColor(0, 255, 0, 200))  # Green
-        pen.setWidth(2)
-        painter.setPen(pen)
+        painter.setPen(self._skeleton_pen)
         
         connections = [
             # Thumb
@@ -200,9 +244,7 @@ class FloatingSkeletonWindow(QWidget):
                                end_point[0], end_point[1])
         
         # Draw landmarks as dots
-        dot_pen = QPen(QColor(255, 0, 0, 200))  # Red dots
-        dot_pen.setWidth(4)
-        painter.setPen(dot_pen)
+        painter.setPen(self._landmark_pen)
         
         for x, y in screen_landmarks:
             painter.drawPoint(x, y)
@@ -214,13 +256,14 @@ class FloatingSkeletonWindow(QWidget):
             
     def mouseMoveEvent(self, event):
         """Handle window dragging"""
-        if hasattr(self, 'drag_position') and event.buttons() == Qt.MouseButton.LeftButton:
+        if self.drag_position is not None and event.buttons() == Qt.MouseButton.LeftButton:
             self.move(event.globalPosition().toPoint() - self.drag_position)
 
 
 class AdOverlayWindow(QWidget):
     def __init__(self):
         super().__init__()
+        self.drag_position = None
         self.setup_window()
         self.setup_timer()
         
@@ -260,14 +303,24 @@ class AdOverlayWindow(QWidget):
         self.setLayout(layout)
         
     def setup_timer(self):
-        """Setup timer for periodic display"""
+        """Setup timer for periodic display (started only while tracking)"""
         self.show_timer = QTimer()
         self.show_timer.timeout.connect(self.show_ad)
-        self.show_timer.start(10000)  # Show every 10 seconds
         
         self.hide_timer = QTimer()
+        self.hide_timer.setSingleShot(True)
         self.hide_timer.timeout.connect(self.hide)
         
+    def start_ads(self):
+        """Start periodic ad display"""
+        self.show_timer.start(10000)  # Show every 10 seconds
+        
+    def stop_ads(self):
+        """Stop periodic ad display and hide the ad"""
+        self.show_timer.stop()
+        self.hide_timer.stop()
+        self.hide()
+        
     def show_ad(self):
         """Show ad for a brief period"""
         self.show()
@@ -280,14 +333,20 @@ class AdOverlayWindow(QWidget):
             
     def mouseMoveEvent(self, event):
         """Handle window dragging"""
-        if hasattr(self, 'drag_position') and event.buttons() == Qt.MouseButton.LeftButton:
+        if self.drag_position is not None and event.buttons() == Qt.MouseButton.LeftButton:
             self.move(event.globalPosition().toPoint() - self.drag_position)
 
 
 class CameraOverlayWindow(QWidget):
     def __init__(self):
         super().__init__()
+        self.drag_position = None
         self.current_frame = None
+        self.current_image = None
+        
+        # Pre-built pen for placeholder text
+        self._placeholder_pen = QPen(QColor(255, 255, 255), 2)
+        
         self.setup_window()
         
     def setup_window(self):
@@ -313,44 +372,41 @@ class CameraOverlayWindow(QWidget):
             }
         """)
         
-    def update_frame(self, frame):
-        """Update camera frame"""
-        if frame is not None:
-            self.current_frame = frame
-            self.update()
+    def update_frame(self, frame, frame_size: Optional[tuple] = None):
+        """Update camera frame (resized to display size once, so Qt never rescales)
+        
+        frame_size (width, height) is required when frame is a cv2.UMat, which has no shape.
+        """
+        if frame is None:
+            return
+            
+        # Fit frame inside the window while keeping aspect ratio
+        width, height = frame_size or frame.shape[1::-1]
+        scale = min(self.width() / width, self.height() / height)
+        display_w, display_h = int(width * scale), int(height * scale)
+        if display_w == 0 or display_h == 0:
+            return
+        
+        # Downscale in OpenCV, then convert the smaller image to RGB
+        small_frame = cv2.resize(frame, (display_w, display_h), interpolation=cv2.INTER_AREA)
+        rgb_frame = to_numpy(cv2.cvtColor(small_frame, cv2.COLOR_BGR2RGB))
+        
+        # Keep a reference to the buffer - QImage does not own the data
+        self.current_frame = rgb_frame
+        self.current_image = QImage(rgb_frame.data, display_w, display_h, 3 * display_w, QImage.Format.Format_RGB888)
+        
+        self.update()
             
     def paintEvent(self, event):
         """Draw camera frame"""
         painter = QPainter(self)
         
-        if self.current_frame is not None:
-            try:
-                # Convert OpenCV frame to Qt format
-                height, width, channel = self.current_frame.shape
-                bytes_per_line = 3 * width
-                
-                # Convert BGR to RGB
-                rgb_frame = cv2.cvtColor(self.current_frame, cv2.COLOR_BGR2RGB)
-                
-                # Create QImage properly
-                q_image = QImage(rgb_frame.data, width, height, bytes_per_line, QImage.Format.Format_RGB888)
-                
-                # Convert to QPixmap and scale
-                pixmap = QPixmap.fromImage(q_image).scaled(
-                    self.size(), 
-                    Qt.AspectRatioMode.KeepAspectRatio, 
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                
-                # Draw the frame
-                painter.drawPixmap(0, 0, pixmap)
-            except Exception as e:
-                # Draw error message if frame conversion fails
-                painter.setPen(QPen(QColor(255, 0, 0), 2))
-                painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, f"Frame Error: {str(e)}")
+        if self.current_image is not None:
+            # Frame is already at display size
+            painter.drawImage(0, 0, self.current_image)
         else:
             # Draw placeholder when no camera frame
-            painter.setPen(QPen(QColor(255, 255, 255), 2))
+            painter.setPen(self._placeholder_pen)
             painter.drawRect(10, 10, self.width()-20, self.height()-20)
             painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, "Camera Feed")
         
@@ -361,7 +417,7 @@ class CameraOverlayWindow(QWidget):
             
     def mouseMoveEvent(self, event):
         """Handle window dragging"""
-        if hasattr(self, 'drag_position') and event.buttons() == Qt.MouseButton.LeftButton:
+        if self.drag_position is not None and event.buttons() == Qt.MouseButton.LeftButton:
             self.move(event.globalPosition().toPoint() - self.drag_position)
 
 
@@ -372,7 +428,9 @@ class RemoteControlWindow(QWidget):
     
     def __init__(self):
         super().__init__()
+        self.drag_position = None
         self.is_recording = False
+        self._bg_pixmap = None  # Styled background, rendered once on first paint
         self.setup_window()
         self.setup_ui()
         
@@ -432,6 +490,31 @@ class RemoteControlWindow(QWidget):
         
         self.setLayout(layout)
         
+    def _render_background(self) -> QPixmap:
+        """Render the stylesheet background/border to a pixmap"""
+        self.ensurePolished()
+        
+        # Device pixels, so the cached border stays sharp on HiDPI/Retina screens
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        option = QStyleOption()
+        option.initFrom(self)
+        painter = QPainter(pixmap)
+        self.style().drawPrimitive(QStyle.PrimitiveElement.PE_Widget, option, painter, self)
+        painter.end()
+        return pixmap
+        
+    def paintEvent(self, event):
+        """Blit the cached background instead of re-evaluating the stylesheet"""
+        # Re-render when first shown or moved to a screen with a different scale factor
+        if self._bg_pixmap is None or self._bg_pixmap.devicePixelRatio() != self.devicePixelRatioF():
+            self._bg_pixmap = self._render_background()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._bg_pixmap)
+        
     def toggle_recording(self):
         """Toggle recording state"""
         if self.is_recording:
@@ -450,22 +533,67 @@ class RemoteControlWindow(QWidget):
             
     def mouseMoveEvent(self, event):
         """Handle window dragging"""
-        if hasattr(self, 'drag_position') and event.buttons() == Qt.MouseButton.LeftButton:
+        if self.drag_position is not None and event.buttons() == Qt.MouseButton.LeftButton:
             self.move(event.globalPosition().toPoint() - self.drag_position)
 
 
+class TrackingSignals(QObject):
+    """Carries tracking-thread results to the overlay widgets on the Qt thread"""
+    camera_frame = pyqtSignal(object, tuple)  # (BGR frame, (width, height))
+    fingertips = pyqtSignal(object, object)  # (fingertip pixels or None, gesture data or None)
+
+
 class SimpleHandOverlay:
     def __init__(self):
-        self.gesture_recognizer = ThumbGestureRecognizer()
+        # Import pyautogui lazily - it probes the display server on import
+        try:
+            import pyautogui
+        except ImportError:
+            print("WARNING: pyautogui not installed, mouse control will be disabled")
+            pyautogui = None
+        self._pg = pyautogui
+        self.screen_size = None  # (width, height) - queried once per tracking session
+        self._move_cursor = None
+        
+        # Cursor smoothing - landmark jitter would otherwise move the cursor every frame
+        self.filter_x = OneEuroFilter(min_cutoff=1.0, beta=0.01)
+        self.filter_y = OneEuroFilter(min_cutoff=1.0, beta=0.01)
+        self.last_cursor = None
+        
+        # Last two measured thumb positions (screen_x, screen_y, time) for extrapolation
+        self.prev_thumb = None
+        self.last_thumb = None
+        
+        self.gesture_recognizer = self._create_recognizer()
         self.hand_overlay_widget = HandOverlayWidget()  # Full screen hand skeleton
         self.ad_window = AdOverlayWindow()
         self.camera_window = CameraOverlayWindow()
         self.remote_window = RemoteControlWindow()
         
         self.cap = None
+        self.reader = None
+        self.tracking_thread = None
         self.is_tracking = False
         self.is_recording = False
         
+        # Motion gate state
+        self.prev_small = None
+        self.frame_count = 0
+        self.hand_present = False  # Hand found by the last inference - gate is bypassed
+        
+        # Reused per-frame output buffers (NumPy path) - full-size ones allocated on first frame
+        self._flip_buf = None
+        self._gray_buf = None
+        self._small_buf = np.empty((INFERENCE_SIZE[1], INFERENCE_SIZE[0], 3), dtype=np.uint8)
+        self._motion_bufs = (np.empty(MOTION_SIZE[::-1], dtype=np.uint8),
+                             np.empty(MOTION_SIZE[::-1], dtype=np.uint8))  # Current/previous alternate
+        
+        # Inference time EMA for adaptive model complexity
+        self.inference_ema_ms = None
+        self.complexity_warmup = COMPLEXITY_WARMUP_FRAMES
+        self.model_dwell_s = MIN_MODEL_DWELL_S
+        self.last_model_switch = 0.0
+        
         # Callback for when tracking is stopped from remote
         self.tracking_stop_callback = None
         
@@ -474,9 +602,10 @@ class SimpleHandOverlay:
         self.remote_window.record_stop.connect(self.stop_recording)
         self.remote_window.tracking_stop.connect(self.on_remote_tracking_stop)
         
-        # Timer for updating
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.process_frame)
+        # Capture and inference run on the tracking thread; widgets are only touched via these signals
+        self.signals = TrackingSignals()
+        self.signals.camera_frame.connect(self.camera_window.update_frame)
+        self.signals.fingertips.connect(self.hand_overlay_widget.update_fingertips)
         
         # Initially hide all overlay windows
         self.hand_overlay_widget.hide()
@@ -484,86 +613,231 @@ class SimpleHandOverlay:
         self.remote_window.hide()
         self.ad_window.hide()
         
+    @staticmethod
+    def _create_recognizer():
+        """Resident gesture server when asked to (GESTURE_SERVER=1) and reachable, else in-process"""
+        recognizer = GestureServerClient.connect() if USE_GESTURE_SERVER else None  # Bounded wait
+        return recognizer or ThumbGestureRecognizer()
+        
     def start_tracking(self):
         """Start hand tracking"""
         if self.is_tracking:
             return
+        
+        if self.gesture_recognizer is None:
+            self.gesture_recognizer = self._create_recognizer()
             
         self.cap = cv2.VideoCapture(0)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Driver drops queued frames instead of serving stale ones
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
         self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
         self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-        
+        self.cap.set(cv2.CAP_PROP_FPS, 30)
+        self.reader = FrameReader(self.cap).start()
+        
+        if self._pg:
+            self.screen_size = self._pg.size()  # Display server query - keep it out of process_frame
+            self._move_cursor = get_move_cursor()
+        
+        self.prev_small = None
+        self.frame_count = 0
+        self.hand_present = False
+        self.inference_ema_ms = None
+        self.complexity_warmup = COMPLEXITY_WARMUP_FRAMES
+        self.model_dwell_s = MIN_MODEL_DWELL_S
+        self.last_model_switch = time.monotonic()
+        self.filter_x.reset()
+        self.filter_y.reset()
+        self.last_cursor = None
+        self.prev_thumb = None
+        self.last_thumb = None
         self.is_tracking = True
         
         # Show all overlay windows when tracking starts
         self.camera_window.show()
         self.remote_window.show()
         # Ad window will show automatically via timer (every 10 seconds)
+        self.ad_window.start_ads()
         
         # Show hand overlay last to ensure it's on top
         self.hand_overlay_widget.show()
         
-        self.timer.start(33)  # ~30 FPS
+        # Capture, motion gate and inference stay off the Qt thread - repaints and input never wait on them
+        self.tracking_thread = threading.Thread(target=self.tracking_loop, daemon=True)
+        self.tracking_thread.start()
         
         print("✅ Hand tracking started with all overlay windows")
         
     def stop_tracking(self):
         """Stop hand tracking"""
         self.is_tracking = False
-        self.timer.stop()
         
+        if self.tracking_thread:
+            self.tracking_thread.join(timeout=1.0)
+            self.tracking_thread = None
+        if self.reader:
+            self.reader.stop()
+            self.reader = None
         if self.cap:
             self.cap.release()
             self.cap = None
+        
+        # Free the server for other clients and unlink the shared frame segment
+        if isinstance(self.gesture_recognizer, GestureServerClient):
+            self.gesture_recognizer.cleanup()
+            self.gesture_recognizer = None
             
         # Hide all overlay windows
         self.hand_overlay_widget.hide()
         self.camera_window.hide()
         self.remote_window.hide()
-        self.ad_window.hide()
-        
-    def process_frame(self):
-        """Process camera frame and update display"""
-        if not self.is_tracking or not self.cap:
-            return
+        self.ad_window.stop_ads()
+        
+    def tracking_loop(self):
+        """Tracking thread: process each new camera frame until tracking stops"""
+        reader = self.reader
+        while self.is_tracking:
+            frame = reader.read(timeout=0.1)  # Timeout so stop_tracking is noticed
+            if frame is not None:
+                self.process_frame(frame)
             
-        ret, frame = self.cap.read()
-        if not ret:
+    def process_frame(self, frame):
+        """Process one camera frame (tracking thread) - widget updates go out as signals"""
+        # Flip frame horizontally for mirror effect (on the GPU when OpenCL is available)
+        frame_size = frame.shape[1::-1]
+        if self._flip_buf is None or self._flip_buf.shape != frame.shape:
+            self._flip_buf = np.empty_like(frame)
+            self._gray_buf = np.empty(frame.shape[:2], dtype=np.uint8)
+        frame = cv2.flip(to_umat(frame), 1, dst=dst_buffer(self._flip_buf))
+        
+        # Update camera overlay - it is only feedback, so a lower refresh rate is enough
+        self.frame_count += 1
+        if self.frame_count % CAMERA_VIEW_INTERVAL == 0:
+            # Copy - the flip buffer is overwritten by the next frame while the Qt thread draws this one
+            self.signals.camera_frame.emit(to_numpy(frame).copy(), frame_size)
+        
+        # Static scene with no hand - nothing to track until something moves
+        moving = self.has_motion(frame)
+        if not self.hand_present and not moving and self.frame_count % MOTION_RECHECK_INTERVAL != 0:
             return
-            
-        # Flip frame horizontally for mirror effect
-        frame = cv2.flip(frame, 1)
-        
-        # Process frame with gesture recognizer
-        processed_frame, gesture_data = self.gesture_recognizer.process_frame(frame)
         
-        # Update camera overlay with current frame
-        self.camera_window.update_frame(frame)
+        # Moving hand - infer on alternate frames, extrapolate the cursor on the others
+        if moving and self.frame_count % INFERENCE_INTERVAL != 0:
+            self.extrapolate_cursor()
+            return
         
-        if gesture_data and gesture_data['landmarks'] is not None:
-            # Update full screen overlay with landmarks and gesture data
-            landmarks = gesture_data['landmarks'].tolist()
-            self.hand_overlay_widget.update_landmarks(landmarks, gesture_data)
+        # Process a downscaled copy with gesture recognizer (camera view keeps full resolution)
+        small_frame = to_numpy(cv2.resize(frame, INFERENCE_SIZE, dst=dst_buffer(self._small_buf),
+                                          interpolation=cv2.INTER_AREA))
+        inference_start = time.perf_counter()
+        processed_frame, gesture_data = self.gesture_recognizer.process_frame(small_frame)
+        self.adapt_model_complexity((time.perf_counter() - inference_start) * 1000)
+        
+        self.hand_present = bool(gesture_data and gesture_data['landmarks'] is not None)
+        if self.hand_present:
+            # Update full screen overlay with fingertip pixels and gesture data
+            fingertips = self.hand_overlay_widget.to_fingertips(gesture_data['landmarks'])
+            self.signals.fingertips.emit(fingertips, gesture_data)
             
             # Move cursor to thumb position (always follow thumb)
             thumb_pos = self.gesture_recognizer.get_thumb_position(gesture_data['landmarks'])
-            if thumb_pos and pyautogui:
-                screen_x = int(thumb_pos[0] * pyautogui.size()[0])
-                screen_y = int(thumb_pos[1] * pyautogui.size()[1])
-                pyautogui.moveTo(screen_x, screen_y, duration=0.01)
+            if thumb_pos and self._pg:
+                now = time.monotonic()
+                screen_x = thumb_pos[0] * self.screen_size[0]
+                screen_y = thumb_pos[1] * self.screen_size[1]
+                self.prev_thumb, self.last_thumb = self.last_thumb, (screen_x, screen_y, now)
+                self.move_cursor(screen_x, screen_y, now)
             
             # Handle gestures for cursor control
             self.handle_gesture(gesture_data)
         else:
             # Clear overlay if no hand detected
-            self.hand_overlay_widget.update_landmarks(None, None)
+            self.signals.fingertips.emit(None, None)
+            self.prev_thumb = self.last_thumb = None
+            self.filter_x.reset()  # Hand may reappear elsewhere - don't glide from here
+            self.filter_y.reset()
+            
+    def move_cursor(self, screen_x: float, screen_y: float, now: float):
+        """One-Euro filter the target and warp the OS cursor if it moved by a whole pixel"""
+        screen_x = round(self.filter_x.filter(screen_x, now))
+        screen_y = round(self.filter_y.filter(screen_y, now))
+        
+        # Sub-pixel changes - skip the OS call
+        if (screen_x, screen_y) != self.last_cursor:
+            self._move_cursor(screen_x, screen_y)  # Native cursor warp - no pyautogui layers
+            self.last_cursor = (screen_x, screen_y)
             
+    def extrapolate_cursor(self):
+        """Linearly extrapolate the cursor from the last two measured thumb positions"""
+        if self.prev_thumb is None or self.last_thumb is None or not self._pg:
+            return
+        
+        prev_x, prev_y, prev_time = self.prev_thumb
+        last_x, last_y, last_time = self.last_thumb
+        if last_time <= prev_time:
+            return
+        
+        now = time.monotonic()
+        k = (now - last_time) / (last_time - prev_time)
+        dx = (last_x - prev_x) * k
+        dy = (last_y - prev_y) * k
+        
+        # Cap the step - the hand may have stopped since the last measurement
+        dist = math.hypot(dx, dy)
+        if dist > MAX_EXTRAPOLATION_PX:
+            dx *= MAX_EXTRAPOLATION_PX / dist
+            dy *= MAX_EXTRAPOLATION_PX / dist
+        
+        self.move_cursor(last_x + dx, last_y + dy, now)
+            
+    def adapt_model_complexity(self, inference_ms: float):
+        """Drop to the lite Hands model when inference can't keep up, go back when it's cheap"""
+        if self.complexity_warmup > 0:
+            self.complexity_warmup -= 1
+            return
+        
+        if self.inference_ema_ms is None:
+            self.inference_ema_ms = inference_ms
+        else:
+            self.inference_ema_ms = 0.9 * self.inference_ema_ms + 0.1 * inference_ms
+        
+        now = time.monotonic()
+        if now - self.last_model_switch < self.model_dwell_s:
+            return  # Each switch rebuilds Hands - stay on this model for a while
+        
+        complexity = self.gesture_recognizer.model_complexity
+        if complexity == 1 and self.inference_ema_ms > LITE_MODEL_ABOVE_MS:
+            new_complexity = 0
+        elif complexity == 0 and self.inference_ema_ms < FULL_MODEL_BELOW_MS:
+            new_complexity = 1
+            # Going back to full may just bounce off the limit again - wait longer next time
+            self.model_dwell_s = min(self.model_dwell_s * 2, MAX_MODEL_DWELL_S)
+        else:
+            return
+        
+        self.gesture_recognizer.set_model_complexity(new_complexity)
+        self.inference_ema_ms = None
+        self.complexity_warmup = COMPLEXITY_WARMUP_FRAMES
+        self.last_model_switch = now
+        print(f"Hand model complexity -> {new_complexity}")
+        
+    def has_motion(self, frame) -> bool:
+        """Cheap frame-difference check against the previous frame"""
+        # Write into whichever motion buffer isn't holding the previous frame
+        small = self._motion_bufs[0] if self.prev_small is self._motion_bufs[1] else self._motion_bufs[1]
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=dst_buffer(self._gray_buf))
+        small = to_numpy(cv2.resize(gray, MOTION_SIZE, dst=dst_buffer(small), interpolation=cv2.INTER_AREA))
+        prev_small, self.prev_small = self.prev_small, small
+        if prev_small is None:
+            return True
+        return cv2.absdiff(prev_small, small).mean() >= MOTION_THRESHOLD
+        
     def handle_gesture(self, gesture_data):
         """Handle detected gestures"""
         gesture_type = gesture_data['type']
         landmarks = gesture_data['landmarks']
         
-        if pyautogui is None:
+        if self._pg is None:
             return
             
         # Handle scroll gestures
@@ -576,26 +850,26 @@ class SimpleHandOverlay:
             
         # Handle click and drag gestures
         if gesture_type == "thumb_index_click":
-            pyautogui.click()
+            self._pg.click()
             
         elif gesture_type == "thumb_index_double_click":
-            pyautogui.doubleClick()
+            self._pg.doubleClick()
             
         elif gesture_type == "thumb_middle_pinch":
-            pyautogui.rightClick()
+            self._pg.rightClick()
             
         elif gesture_type == "thumb_index_pinch_start":
-            pyautogui.mouseDown()
+            self._pg.mouseDown()
             
         elif gesture_type == "thumb_index_drag":
             pass  # Mouse position is already being updated
             
         elif gesture_type == "thumb_index_drag_end":
-            pyautogui.mouseUp()
+            self._pg.mouseUp()
     
     def handle_scroll(self, scroll_speed: float):
         """Handle scroll gesture based on Y-axis movement"""
-        if pyautogui is None:
+        if self._pg is None:
             return
             
         # Convert scroll speed to scroll units
@@ -605,7 +879,7 @@ class SimpleHandOverlay:
         
         # Apply scroll if above threshold
         if abs(scroll_units) >= 1:
-            pyautogui.scroll(scroll_units)
+            self._pg.scroll(scroll_units)
             
     def start_recording(self):
         """Start recording functionality"""
@@ -2,32 +2,30 @@
 Thumb-based gesture recognition system using MediaPipe
 """
 
+import os
 import cv2
 import mediapipe as mp
 import numpy as np
 import time
-from typing import Optional, Tuple, List, Dict
+from typing import Optional, Tuple, List, Dict, Callable
+from config.settings import HAND_LANDMARKER_MODEL_PATH
 
 
 class ThumbGestureRecognizer:
     def __init__(self):
         self.mp_hands = mp.solutions.hands
         self.mp_drawing = mp.solutions.drawing_utils
-        self.hands = self.mp_hands.Hands(
-            static_image_mode=False,
-            max_num_hands=1,
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.5
-        )
+        self.model_complexity = 1  # 1 = full, 0 = lite landmark model
+        self.hands = self._create_hands(self.model_complexity)
         
-        # For double-click detection
+        # For double-click detection (timestamps are time.monotonic_ns() integers)
         self.last_click_time = 0
-        self.double_click_threshold = 0.5  # seconds
-        self.click_cooldown = 0.15  # prevent multiple clicks (더 긴 쿨다운: 0.1 → 0.15)
+        self.double_click_threshold_ns = 500_000_000  # 0.5 s
+        self.click_cooldown_ns = 150_000_000  # prevent multiple clicks (더 긴 쿨다운: 0.1 → 0.15 s)
         self.last_gesture_time = 0
         
         # For gesture debouncing (연속 제스처 방지)
-        self.gesture_debounce_time = 0.2  # 제스처 간 최소 간격
+        self.gesture_debounce_ns = 200_000_000  # 제스처 간 최소 간격 (0.2 s)
         self.last_any_gesture_time = 0
         
         # For tracking thumb-index state
@@ -43,29 +41,132 @@ class ThumbGestureRecognizer:
         # For drag detection (thumb + index pinch hold)
         self.is_dragging = False
         self.drag_start_time = 0
+        self.drag_hold_ns = 150_000_000  # Pinch held longer than 0.15 s = drag
+        
+        # Reusable RGB buffer for MediaPipe input (allocated on first frame)
+        self._rgb_buf = None
+        
+        # LIVE_STREAM mode (MediaPipe Tasks HandLandmarker), see start_live_stream()
+        self.landmarker = None
+        self._result_callback = None
+        
+    def reset_gesture_state(self):
+        """Forget click/drag/scroll state (e.g. when a new gesture server client connects)"""
+        self.last_click_time = 0
+        self.last_gesture_time = 0
+        self.last_any_gesture_time = 0
+        self.previous_thumb_index_distance = None
+        self.was_touching = False
+        self.thumb_index_middle_scroll_start_pos = None
+        self.is_thumb_index_middle_scrolling = False
+        self.is_dragging = False
+        self.drag_start_time = 0
+        
+    def _create_hands(self, model_complexity: int):
+        """Create the synchronous MediaPipe Hands solver"""
+        return self.mp_hands.Hands(
+            static_image_mode=False,
+            max_num_hands=1,
+            min_detection_confidence=0.7,
+            min_tracking_confidence=0.5,
+            model_complexity=model_complexity
+        )
+        
+    def set_model_complexity(self, model_complexity: int):
+        """Switch the Hands landmark model (0 = lite, 1 = full); re-creates the solver"""
+        if model_complexity == self.model_complexity:
+            return
+        
+        old_hands = self.hands
+        self.hands = self._create_hands(model_complexity)
+        self.model_complexity = model_complexity
+        old_hands.close()
         
     def process_frame(self, frame: np.ndarray) -> Tuple[np.ndarray, Optional[Dict]]:
         """Process video frame and detect thumb-based gestures"""
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = self.hands.process(rgb_frame)
+        # Reuse the RGB buffer instead of allocating a new one every frame
+        if self._rgb_buf is None or self._rgb_buf.shape != frame.shape:
+            self._rgb_buf = np.empty(frame.shape, dtype=np.uint8)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+        
+        # Mark read-only so MediaPipe can skip its internal copy
+        self._rgb_buf.flags.writeable = False
+        try:
+            results = self.hands.process(self._rgb_buf)
+        finally:
+            self._rgb_buf.flags.writeable = True  # Next cvtColor writes into it again
         
         gesture_data = None
         
         if results.multi_hand_landmarks:
             for hand_landmarks in results.multi_hand_landmarks:
                 # Extract gesture data
-                gesture_data = self._extract_thumb_gesture(hand_landmarks)
+                gesture_data = self._extract_thumb_gesture(hand_landmarks.landmark)
                 
         return frame, gesture_data
     
-    def _extract_thumb_gesture(self, landmarks) -> Dict:
-        """Extract thumb-based gestures from hand landmarks"""
-        # Get landmark positions
-        positions = []
-        for lm in landmarks.landmark:
-            positions.append([lm.x, lm.y, lm.z])
+    def start_live_stream(self, result_callback: Callable[[Optional[Dict]], None],
+                          model_path: str = HAND_LANDMARKER_MODEL_PATH) -> bool:
+        """Switch to MediaPipe LIVE_STREAM mode; result_callback(gesture_data) is called per frame
+        
+        Falls back to synchronous processing (still reported through the callback)
+        when the model file or the Tasks API is not available.
+        """
+        self._result_callback = result_callback
+        if self.landmarker is not None:
+            return True
+        
+        if not os.path.exists(model_path):
+            print(f"WARNING: {model_path} not found, using synchronous hand tracking")
+            return False
         
-        positions = np.array(positions)
+        from mediapipe.tasks.python import BaseOptions
+        from mediapipe.tasks.python import vision
+        
+        # Prefer the GPU delegate; not every platform supports it
+        for delegate in (BaseOptions.Delegate.GPU, BaseOptions.Delegate.CPU):
+            try:
+                options = vision.HandLandmarkerOptions(
+                    base_options=BaseOptions(model_asset_path=model_path, delegate=delegate),
+                    running_mode=vision.RunningMode.LIVE_STREAM,
+                    num_hands=1,
+                    min_hand_detection_confidence=0.7,
+                    min_tracking_confidence=0.5,
+                    result_callback=self._on_live_stream_result
+                )
+                self.landmarker = vision.HandLandmarker.create_from_options(options)
+                return True
+            except Exception as e:
+                print(f"WARNING: HandLandmarker ({delegate.name}) unavailable: {e}")
+        
+        return False
+    
+    def process_frame_async(self, frame: np.ndarray, timestamp_ms: int):
+        """Submit a frame in LIVE_STREAM mode; the result arrives via the callback"""
+        if self.landmarker is None:
+            _, gesture_data = self.process_frame(frame)
+            self._result_callback(gesture_data)
+            return
+        
+        # MediaPipe keeps the image until inference finishes, so use a fresh RGB array
+        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        self.landmarker.detect_async(mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame), timestamp_ms)
+    
+    def _on_live_stream_result(self, result, output_image, timestamp_ms: int):
+        """HandLandmarker result callback (runs on MediaPipe's thread)"""
+        gesture_data = None
+        if result.hand_landmarks:
+            gesture_data = self._extract_thumb_gesture(result.hand_landmarks[0])
+        self._result_callback(gesture_data)
+    
+    def _extract_thumb_gesture(self, landmarks) -> Dict:
+        """Extract thumb-based gestures from a sequence of 21 hand landmarks"""
+        # Get landmark positions as a (21, 3) array without building nested lists
+        positions = np.fromiter(
+            (v for lm in landmarks for v in (lm.x, lm.y, lm.z)),
+            dtype=np.float32,
+            count=len(landmarks) * 3
+        ).reshape(-1, 3)
         
         # Detect specific gestures
         gesture_type = self._classify_thumb_gesture(positions)
@@ -78,10 +179,11 @@ class ThumbGestureRecognizer:
     
     def _classify_thumb_gesture(self, positions: np.ndarray) -> str:
         """Classify thumb-based gestures"""
-        current_time = time.time()
+        # Monotonic integer clock - can't go backwards on wall-clock adjustments
+        current_time = time.monotonic_ns()
         
         # Apply gesture debouncing to prevent over-sensitive detection
-        if current_time - self.last_any_gesture_time < self.gesture_debounce_time:
+        if current_time - self.last_any_gesture_time < self.gesture_debounce_ns:
             return "no_gesture"
         
         # Landmark indices
@@ -112,7 +214,7 @@ class ThumbGestureRecognizer:
         
         # Check for thumb-middle pinch (right click)
         if thumb_middle_distance < self.touch_threshold:
-            if current_time - self.last_gesture_time > self.click_cooldown:
+            if current_time - self.last_gesture_time > self.click_cooldown_ns:
                 self.last_gesture_time = current_time
                 self.last_any_gesture_time = current_time  # Update debounce timer
                 return "thumb_middle_pinch"
@@ -123,12 +225,12 @@ class ThumbGestureRecognizer:
         if is_touching:
             if not self.was_touching:
                 # Just started pinch
-                if current_time - self.last_gesture_time > self.click_cooldown:
+                if current_time - self.last_gesture_time > self.click_cooldown_ns:
                     self.last_gesture_time = current_time
                     self.drag_start_time = current_time
                     
                     # Check for double-click
-                    if current_time - self.last_click_time < self.double_click_threshold:
+                    if current_time - self.last_click_time < self.double_click_threshold_ns:
                         self.last_click_time = 0
                         self.was_touching = is_touching
                         self.last_any_gesture_time = current_time  # Update debounce timer
@@ -141,7 +243,7 @@ class ThumbGestureRecognizer:
                         return "thumb_index_pinch_start"
             else:
                 # Continuing pinch - check if it's drag
-                if self.is_dragging and current_time - self.drag_start_time > 0.15:
+                if self.is_dragging and current_time - self.drag_start_time > self.drag_hold_ns:
                     return "thumb_index_drag"
                 else:
                     return "thumb_index_pinch_hold"
@@ -152,7 +254,7 @@ class ThumbGestureRecognizer:
                 self.is_dragging = False
                 self.was_touching = False
                 
-                if drag_duration < 0.15:  # Short duration = click
+                if drag_duration < self.drag_hold_ns:  # Short duration = click
                     self.last_any_gesture_time = current_time  # Update debounce timer
                     return "thumb_index_click"
                 else:  # Long duration = drag end
@@ -214,4 +316,7 @@ class ThumbGestureRecognizer:
     def cleanup(self):
         """Clean up resources"""
         if self.hands:
-            self.hands.close()
\ No newline at end of file
+            self.hands.close()
+        if self.landmarker:
+            self.landmarker.close()
+            self.landmarker = None
\ No newline at end of file
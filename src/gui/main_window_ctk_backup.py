@@ -5,14 +5,9 @@ Main GUI application window using CustomTkinter
 import customtkinter as ctk
 import tkinter as tk
 from tkinter import messagebox
-import threading
-import cv2
-from PIL import Image, ImageTk
 import sys
 import os
 
-from src.auth.google_auth import GoogleAuthenticator  
-from src.face.face_recognition_system import FaceRecognitionSystem
 from src.gesture.thumb_gesture_recognizer import ThumbGestureRecognizer
 from src.gesture.mouse_controller import MouseController
 from src.gui.tracking_window import TrackingWindow
@@ -30,18 +25,36 @@ class GestureControlApp:
         self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         
         # Initialize components
-        self.auth = GoogleAuthenticator()
-        self.face_system = FaceRecognitionSystem()
+        # Auth and face recognition pull in heavy dependencies - created on first use
+        self._auth = None
+        self._face_system = None
         self.gesture_recognizer = ThumbGestureRecognizer()
         self.mouse_controller = MouseController()
         
         # Application state
         self.current_user = None
         self.is_tracking = False
+        self.preview_camera = None
         
         # Initialize UI
         self.setup_ui()
         
+    @property
+    def auth(self):
+        """Google authenticator (imported and created lazily)"""
+        if self._auth is None:
+            from src.auth.google_auth import GoogleAuthenticator
+            self._auth = GoogleAuthenticator()
+        return self._auth
+    
+    @property
+    def face_system(self):
+        """Face recognition system (imported and created lazily)"""
+        if self._face_system is None:
+            from src.face.face_recognition_system import FaceRecognitionSystem
+            self._face_system = FaceRecognitionSystem()
+        return self._face_system
+        
     def setup_ui(self):
         """Set up the main UI"""
         self.current_frame = None
@@ -233,36 +246,57 @@ class GestureControlApp:
     
     def start_camera_preview(self):
         """Start camera preview for face operations"""
-        def camera_thread():
-            cap = cv2.VideoCapture(CAMERA_INDEX)
-            cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
-            cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
-            
-            while hasattr(self, 'camera_label') and self.camera_label.winfo_exists():
-                ret, frame = cap.read()
-                if ret:
-                    # Convert to RGB and resize for display
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    frame_resized = cv2.resize(frame_rgb, (400, 300))
-                    
-                    # Convert to PhotoImage
-                    image = Image.fromarray(frame_resized)
-                    photo = ImageTk.PhotoImage(image)
-                    
-                    # Update label
-                    try:
-                        self.camera_label.configure(image=photo, text="")
-                        self.camera_label.image = photo  # Keep a reference
-                        self.current_camera_frame = frame
-                    except:
-                        break
-                else:
-                    break
+        import numpy as np
+        from PIL import Image, ImageTk
+        from src.utils.camera_stream import CameraBroadcaster
+        
+        # Reusable display buffers - RGBA so the PIL image aliases the numpy buffer (no fromarray copy)
+        self._preview_small = np.empty((300, 400, 3), np.uint8)
+        self._preview_buf = np.zeros((300, 400, 4), np.uint8)
+        self._preview_img = Image.frombuffer('RGBA', (400, 300), self._preview_buf, 'raw', 'RGBA', 0, 1)
+        
+        # Single PhotoImage per preview - frames are pasted into it instead of rebuilding
+        self.preview_photo = ImageTk.PhotoImage(self._preview_img)
+        self.camera_label.configure(image=self.preview_photo, text="")
+        self.camera_label.image = self.preview_photo  # Keep a reference
+        
+        # Already running from the previous page - the refresh loop picks up the new label
+        if self.preview_camera:
+            return
+        
+        # Frames are captured in a separate process; the Tk thread only polls and renders
+        self.preview_camera = CameraBroadcaster(CAMERA_INDEX, FACE_CAMERA_WIDTH, FACE_CAMERA_HEIGHT,
+                                                fps=CAMERA_FPS).start()
+        self.root.after(33, self._refresh_preview)
+    
+    def _refresh_preview(self):
+        """Render the latest shared camera frame into the preview label (runs on the Tk thread)"""
+        import cv2
+        
+        if not self.preview_camera:
+            return
+        
+        if not (hasattr(self, 'camera_label') and self.camera_label.winfo_exists()):
+            self.stop_camera_preview()
+            return
+        
+        frame = self.preview_camera.read(timeout=0)
+        if frame is not None:
+            # Resize for display, then convert the smaller image into the aliased RGBA buffer
+            cv2.resize(frame, (400, 300), dst=self._preview_small, interpolation=cv2.INTER_AREA)
+            cv2.cvtColor(self._preview_small, cv2.COLOR_BGR2RGBA, dst=self._preview_buf)
             
-            cap.release()
+            # Update label image in place
+            self.preview_photo.paste(self._preview_img)
+            self.current_camera_frame = frame.copy()  # read() reuses its buffer
         
-        self.camera_thread = threading.Thread(target=camera_thread, daemon=True)
-        self.camera_thread.start()
+        self.root.after(33, self._refresh_preview)
+    
+    def stop_camera_preview(self):
+        """Stop the camera preview capture process"""
+        if self.preview_camera:
+            self.preview_camera.stop()
+            self.preview_camera = None
     
     def capture_face_for_registration(self):
         """Capture and register face"""
@@ -372,5 +406,6 @@ class GestureControlApp:
         if hasattr(self, 'tracking_window') and self.is_tracking:
             self.tracking_window.stop()
         
+        self.stop_camera_preview()
         self.gesture_recognizer.cleanup()
         self.root.destroy()
\ No newline at end of file
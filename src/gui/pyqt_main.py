@@ -6,9 +6,11 @@ Enhanced version with modern UI styling
 import sys
 import platform
 import os
+import functools
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
-                           QPushButton, QLabel, QWidget, QFrame, QMessageBox, QTextEdit)
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+                           QPushButton, QLabel, QWidget, QFrame, QMessageBox, QTextEdit,
+                           QStackedWidget)
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer
 from PyQt6.QtGui import QFont, QPalette, QColor
 
 # Windows DPI 인식 설정 (한 번만 실행)
@@ -26,74 +28,83 @@ def setup_dpi_awareness():
         os.environ.setdefault("QT_SCALE_FACTOR", "1")
         _DPI_INITIALIZED = True
 
-from src.gesture.simple_overlay import SimpleHandOverlay
 from config.settings import APP_NAME, WINDOW_WIDTH, WINDOW_HEIGHT
 
 
+@functools.lru_cache(maxsize=1)
+def _load_dark_qss() -> str:
+    """Read the dark theme stylesheet once per process"""
+    try:
+        style_path = os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'styles', 'dark_theme.qss')
+        style_path = os.path.abspath(style_path)
+        if os.path.exists(style_path):
+            with open(style_path, 'r', encoding='utf-8') as f:
+                return f.read()
+        # Fallback to inline styles
+        return """
+            QMainWindow { background-color: #2b2b2b; color: #ffffff; }
+            QWidget { background-color: #2b2b2b; color: #ffffff; }
+            QPushButton { background-color: #404040; border: 2px solid #606060; 
+                        border-radius: 8px; padding: 12px 24px; font-size: 14px; 
+                        font-weight: bold; color: #ffffff; }
+            QPushButton:hover { background-color: #505050; border-color: #707070; }
+            QLabel { color: #ffffff; background: transparent; }
+            QFrame { background-color: #353535; border-radius: 10px; padding: 20px; }
+        """
+    except Exception:
+        # Minimal fallback
+        return "QMainWindow { background-color: #2b2b2b; color: #ffffff; }"
+
+
+def apply_dark_theme(app: QApplication):
+    """Apply the dark theme application-wide - parsed once, inherited by every window and dialog"""
+    app.setStyleSheet(_load_dark_qss())
+
+
 class PyQtMainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.hand_overlay = None
         self.current_user = {'name': 'User', 'email': 'user@example.com'}  # Simplified user info
         self.is_authenticated = False
-        self.setup_dark_theme()
-        self.init_ui()
         
-    def setup_dark_theme(self):
-        """Set up modern dark theme from external stylesheet"""
-        try:
-            style_path = os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'styles', 'dark_theme.qss')
-            style_path = os.path.abspath(style_path)
-            if os.path.exists(style_path):
-                with open(style_path, 'r', encoding='utf-8') as f:
-                    self.setStyleSheet(f.read())
-            else:
-                # Fallback to inline styles
-                self.setStyleSheet("""
-                    QMainWindow { background-color: #2b2b2b; color: #ffffff; }
-                    QWidget { background-color: #2b2b2b; color: #ffffff; }
-                    QPushButton { background-color: #404040; border: 2px solid #606060; 
-                                border-radius: 8px; padding: 12px 24px; font-size: 14px; 
-                                font-weight: bold; color: #ffffff; }
-                    QPushButton:hover { background-color: #505050; border-color: #707070; }
-                    QLabel { color: #ffffff; background: transparent; }
-                    QFrame { background-color: #353535; border-radius: 10px; padding: 20px; }
-                """)
-        except Exception:
-            # Minimal fallback
-            self.setStyleSheet("QMainWindow { background-color: #2b2b2b; color: #ffffff; }")
+        # Fonts are built once and shared by the page builders
+        self._title_font = QFont()
+        self._title_font.setPointSize(32)
+        self._title_font.setBold(True)
+        self._welcome_font = QFont()
+        self._welcome_font.setPointSize(18)
+        
+        self.init_ui()
         
     def init_ui(self):
         self.setWindowTitle(APP_NAME)
         self.setGeometry(100, 100, WINDOW_WIDTH, WINDOW_HEIGHT)
         
-        # Central widget
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
+        # Pages are built once and switched, not rebuilt on every navigation
+        self.stack = QStackedWidget()
+        self.stack.setUpdatesEnabled(False)  # One polish/layout pass once both pages are assembled
+        self.setCentralWidget(self.stack)
+        self.stack.addWidget(self._build_login_page())
+        self.stack.addWidget(self._build_main_page())
+        self.stack.setUpdatesEnabled(True)
         
         # Show login page initially
         self.show_login_page()
     
-    def show_login_page(self):
-        """Display login page"""
-        self.clear_current_layout()
-        
-        # Create new central widget
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
+    def _build_login_page(self) -> QWidget:
+        """Build login page"""
+        page = QWidget()
         
         # Main layout
-        layout = QVBoxLayout(central_widget)
+        layout = QVBoxLayout(page)
         layout.setContentsMargins(50, 50, 50, 50)
         layout.setSpacing(30)
         
         # Title
         title = QLabel(APP_NAME)
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_font = QFont()
-        title_font.setPointSize(32)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(self._title_font)
         layout.addWidget(title)
         
         # Spacing
@@ -112,17 +123,14 @@ class PyQtMainWindow(QMainWindow):
         layout.addLayout(button_layout)
         
         layout.addStretch()
+        return page
     
-    def show_main_page(self):
-        """Display main page after login"""
-        self.clear_current_layout()
-        
-        # Create new central widget
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
+    def _build_main_page(self) -> QWidget:
+        """Build main page shown after login"""
+        page = QWidget()
         
         # Main layout
-        layout = QVBoxLayout(central_widget)
+        layout = QVBoxLayout(page)
         layout.setContentsMargins(40, 40, 40, 40)
         layout.setSpacing(20)
         
@@ -130,12 +138,10 @@ class PyQtMainWindow(QMainWindow):
         user_frame = QFrame()
         user_layout = QVBoxLayout(user_frame)
         
-        welcome_label = QLabel(f"환영합니다, {self.current_user['name']}님!")
-        welcome_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        welcome_font = QFont()
-        welcome_font.setPointSize(18)
-        welcome_label.setFont(welcome_font)
-        user_layout.addWidget(welcome_label)
+        self.welcome_label = QLabel()
+        self.welcome_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.welcome_label.setFont(self._welcome_font)
+        user_layout.addWidget(self.welcome_label)
         
         layout.addWidget(user_frame)
         
@@ -191,21 +197,24 @@ class PyQtMainWindow(QMainWindow):
         layout.addLayout(control_button_layout)
         
         layout.addStretch()
+        return page
+    
+    def show_login_page(self):
+        """Display login page"""
+        self.stack.setCurrentIndex(0)
     
-    def clear_current_layout(self):
-        """Clear current layout"""
-        # Since we create a new central widget each time, 
-        # just delete the old central widget if it exists
-        old_widget = self.centralWidget()
-        if old_widget:
-            old_widget.deleteLater()
-            QApplication.processEvents()
+    def show_main_page(self):
+        """Display main page after login"""
+        self.welcome_label.setText(f"환영합니다, {self.current_user['name']}님!")
+        self.stack.setCurrentIndex(1)
         
+    @pyqtSlot()
     def on_login(self):
         """Handle login button click"""
         self.is_authenticated = True
         self.show_main_page()
         
+    @pyqtSlot()
     def show_help(self):
         """Show help dialog"""
         help_text = """제스처 가이드:
@@ -223,27 +232,29 @@ class PyQtMainWindow(QMainWindow):
         msg = QMessageBox()
         msg.setWindowTitle("제스처 도움말")
         msg.setText(help_text)
-        msg.setStyleSheet(self.styleSheet())
         msg.exec()
         
+    @pyqtSlot()
     def show_settings(self):
         """Show settings (placeholder)"""
         msg = QMessageBox()
         msg.setWindowTitle("설정")
         msg.setText("설정 기능은 추후 업데이트 예정입니다.")
-        msg.setStyleSheet(self.styleSheet())
         msg.exec()
         
+    @pyqtSlot()
     def logout(self):
         """Return to login page"""
-        if self.hand_overlay:
-            self.hand_overlay.stop_tracking()
+        self.stop_tracking()
         self.is_authenticated = False
         self.show_login_page()
         
+    @pyqtSlot()
     def start_tracking(self):
         """Start hand tracking with overlay"""
         if self.hand_overlay is None:
+            # Deferred import - pulls in MediaPipe/OpenCV, not needed until tracking starts
+            from src.gesture.simple_overlay import SimpleHandOverlay
             self.hand_overlay = SimpleHandOverlay()
             # Set callback for remote tracking stop
             self.hand_overlay.set_tracking_stop_callback(self.on_remote_tracking_stopped)
@@ -252,6 +263,7 @@ class PyQtMainWindow(QMainWindow):
         self.start_button.hide()
         self.stop_button.show()
         
+    @pyqtSlot()
     def stop_tracking(self):
         """Stop hand tracking"""
         if self.hand_overlay:
@@ -260,6 +272,7 @@ class PyQtMainWindow(QMainWindow):
         self.stop_button.hide()
         self.start_button.show()
         
+    @pyqtSlot()
     def on_remote_tracking_stopped(self):
         """Handle tracking stopped from remote control"""
         # Update button states to match the stop_tracking method
@@ -276,6 +289,7 @@ class PyQtMainWindow(QMainWindow):
 def main():
     setup_dpi_awareness()
     app = QApplication(sys.argv)
+    apply_dark_theme(app)
     window = PyQtMainWindow()
     window.show()
     sys.exit(app.exec())
@@ -7,6 +7,48 @@ import tkinter as tk
 from tkinter import messagebox
 from config.settings import *
 
+# Display names for selectable gestures
+_GESTURE_DISPLAY_NAMES = {
+    "index_finger_tap": "검지 탭",
+    "thumb_tap": "엄지 탭",
+    "middle_finger_tap": "중지 탭",
+    "pinky_tap": "새끼손가락 탭",
+    "thumb_up_down": "엄지 위/아래",
+    "two_finger_scroll": "두 손가락 스크롤",
+    "peace_sign": "피스 사인 (✌️)",
+    "ok_sign": "OK 사인 (👌)",
+    "fist": "주먹",
+    "stop_gesture": "정지 제스처",
+    "timeout": "타임아웃"
+}
+
+# Features backed by GESTURE_MAPPING -> their key in the mapping
+_FEATURE_MAPPING_KEYS = {
+    "left_click": "left_click",
+    "right_click": "right_click",
+    "voice_start": "start_voice",
+    "voice_stop": "stop_voice"
+}
+
+# Features without a configurable mapping yet
+_FIXED_FEATURE_GESTURES = {
+    "scroll": "thumb_up_down",
+    "tracking_stop": "stop_gesture"
+}
+
+# Feature list: (feature_id, feature_name, ((gesture, display_name), ...))
+_FEATURES = tuple(
+    (feature_id, feature_name, tuple((g, _GESTURE_DISPLAY_NAMES.get(g, g)) for g in gestures))
+    for feature_id, feature_name, gestures in (
+        ("left_click", "좌클릭", ("index_finger_tap", "thumb_tap")),
+        ("right_click", "우클릭", ("middle_finger_tap", "pinky_tap")),
+        ("scroll", "휠 스크롤", ("thumb_up_down", "two_finger_scroll")),
+        ("voice_start", "음성 시작", ("peace_sign", "ok_sign")),
+        ("voice_stop", "음성 종료", ("fist", "stop_gesture")),
+        ("tracking_stop", "트래킹 종료", ("stop_gesture", "timeout"))
+    )
+)
+
 class SettingsWindow:
     def __init__(self, parent):
         self.parent = parent
@@ -138,25 +180,24 @@ class SettingsWindow:
         )
         gesture_title.pack(anchor="w", padx=20, pady=(20, 10))
         
-        # Feature list
-        features = [
-            ("left_click", "좌클릭", ["index_finger_tap", "thumb_tap"]),
-            ("right_click", "우클릭", ["middle_finger_tap", "pinky_tap"]),
-            ("scroll", "휠 스크롤", ["thumb_up_down", "two_finger_scroll"]),
-            ("voice_start", "음성 시작", ["peace_sign", "ok_sign"]),
-            ("voice_stop", "음성 종료", ["fist", "stop_gesture"]),
-            ("tracking_stop", "트래킹 종료", ["stop_gesture", "timeout"])
-        ]
-        
         self.feature_widgets = {}
         
-        for feature_id, feature_name, gesture_options in features:
+        for feature_id, feature_name, gesture_options in _FEATURES:
             self.create_feature_setting(
                 gesture_frame, feature_id, feature_name, gesture_options
             )
+        
+        # Live assignment maps for conflict checks in set_gesture
+        # (gesture -> set of features, so a mapping that starts with duplicates loses none)
+        self._feature_to_gesture = {
+            fid: widgets["gesture_var"].get() for fid, widgets in self.feature_widgets.items()
+        }
+        self._gesture_to_features = {}
+        for fid, gesture in self._feature_to_gesture.items():
+            self._gesture_to_features.setdefault(gesture, set()).add(fid)
     
     def create_feature_setting(self, parent, feature_id, feature_name, gesture_options):
-        """Create individual feature setting"""
+        """Create individual feature setting (gesture_options: (gesture, display_name) pairs)"""
         feature_frame = ctk.CTkFrame(parent)
         feature_frame.pack(fill="x", padx=20, pady=5)
         
@@ -200,10 +241,10 @@ class SettingsWindow:
         current_gesture = self.get_current_gesture(feature_id)
         gesture_var.set(current_gesture)
         
-        for gesture in gesture_options:
+        for gesture, display_name in gesture_options:
             radio = ctk.CTkRadioButton(
                 dropdown_frame,
-                text=self.get_gesture_display_name(gesture),
+                text=display_name,
                 variable=gesture_var,
                 value=gesture,
                 command=lambda g=gesture, fid=feature_id: self.set_gesture(fid, g)
@@ -220,32 +261,14 @@ class SettingsWindow:
     
     def get_current_gesture(self, feature_id):
         """Get current gesture for feature"""
-        mapping = {
-            "left_click": self.settings["gesture_mappings"]["left_click"],
-            "right_click": self.settings["gesture_mappings"]["right_click"],
-            "scroll": "thumb_up_down",
-            "voice_start": self.settings["gesture_mappings"]["start_voice"],
-            "voice_stop": self.settings["gesture_mappings"]["stop_voice"],
-            "tracking_stop": "stop_gesture"
-        }
-        return mapping.get(feature_id, "index_finger_tap")
+        mapping_key = _FEATURE_MAPPING_KEYS.get(feature_id)
+        if mapping_key:
+            return self.settings["gesture_mappings"][mapping_key]
+        return _FIXED_FEATURE_GESTURES.get(feature_id, "index_finger_tap")
     
     def get_gesture_display_name(self, gesture):
         """Get display name for gesture"""
-        names = {
-            "index_finger_tap": "검지 탭",
-            "thumb_tap": "엄지 탭",
-            "middle_finger_tap": "중지 탭",
-            "pinky_tap": "새끼손가락 탭",
-            "thumb_up_down": "엄지 위/아래",
-            "two_finger_scroll": "두 손가락 스크롤",
-            "peace_sign": "피스 사인 (✌️)",
-            "ok_sign": "OK 사인 (👌)",
-            "fist": "주먹",
-            "stop_gesture": "정지 제스처",
-            "timeout": "타임아웃"
-        }
-        return names.get(gesture, gesture)
+        return _GESTURE_DISPLAY_NAMES.get(gesture, gesture)
     
     def toggle_dropdown(self, feature_id):
         """Toggle dropdown visibility"""
@@ -276,28 +299,26 @@ class SettingsWindow:
     def set_gesture(self, feature_id, gesture):
         """Set gesture for feature"""
         # Check for conflicts
-        current_mappings = {}
-        for fid, widgets in self.feature_widgets.items():
-            if fid != feature_id:
-                current_mappings[fid] = widgets["gesture_var"].get()
-        
-        if gesture in current_mappings.values():
+        if self._gesture_to_features.get(gesture, set()) - {feature_id}:
             messagebox.showwarning(
                 "제스처 충돌",
                 f"'{self.get_gesture_display_name(gesture)}' 제스처가 이미 다른 기능에 할당되어 있습니다."
             )
             return
         
-        # Update mapping
-        mapping_keys = {
-            "left_click": "left_click",
-            "right_click": "right_click", 
-            "voice_start": "start_voice",
-            "voice_stop": "stop_voice"
-        }
+        # Update assignment maps
+        old_gesture = self._feature_to_gesture.get(feature_id)
+        old_owners = self._gesture_to_features.get(old_gesture)
+        if old_owners is not None:
+            old_owners.discard(feature_id)
+            if not old_owners:
+                del self._gesture_to_features[old_gesture]
+        self._feature_to_gesture[feature_id] = gesture
+        self._gesture_to_features.setdefault(gesture, set()).add(feature_id)
         
-        if feature_id in mapping_keys:
-            self.settings["gesture_mappings"][mapping_keys[feature_id]] = gesture
+        # Update mapping
+        if feature_id in _FEATURE_MAPPING_KEYS:
+            self.settings["gesture_mappings"][_FEATURE_MAPPING_KEYS[feature_id]] = gesture
     
     def save_settings(self):
         """Save settings"""
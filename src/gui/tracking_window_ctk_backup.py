@@ -4,12 +4,29 @@ Tracking window for gesture control
 
 import customtkinter as ctk
 import tkinter as tk
-import cv2
 import threading
+import queue
+import platform
 import time
-from PIL import Image, ImageTk
 from config.settings import *
 
+PREVIEW_FPS = 20  # Camera preview refresh cap
+SMALL_SIZE = (640, 360)  # Recognizer input - MediaPipe runs at ~256 px internally anyway
+
+# Status-bar text for recognized gestures
+_GESTURE_STATUS_TEXT = {
+    "index_finger_point": "검지 포인팅",
+    "index_finger_tap": "좌클릭",
+    "middle_finger_tap": "우클릭",
+    "thumb_up": "스크롤 업",
+    "thumb_down": "스크롤 다운",
+    "peace_sign": "피스 사인",
+    "fist": "주먹",
+    "open_hand": "손바닥",
+    "unknown": "알 수 없음",
+    "없음": "없음"
+}
+
 class TrackingWindow:
     def __init__(self, gesture_recognizer, mouse_controller, stop_callback):
         self.gesture_recognizer = gesture_recognizer
@@ -26,6 +43,10 @@ class TrackingWindow:
         self.show_skeleton = True
         self.is_recording = False
         
+        # UI updates posted by the tracking thread, applied on the Tk thread by _drain_ui
+        self._ui_queue = queue.Queue(maxsize=4)
+        self._last_gesture = None  # Gesture currently shown in the status bar
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -65,6 +86,16 @@ class TrackingWindow:
         )
         self.camera_label.pack(expand=True, padx=20, pady=20)
         
+        # Reusable display buffers - RGBA so the PIL image shares memory with the numpy buffer
+        import numpy as np
+        from PIL import Image, ImageTk
+        
+        self._small_buf = np.empty((SMALL_SIZE[1], SMALL_SIZE[0], 3), np.uint8)  # Downscaled BGR frame
+        self._resized_buf = np.zeros((SMALL_SIZE[1], SMALL_SIZE[0], 4), np.uint8)
+        self._pil_img = Image.frombuffer('RGBA', SMALL_SIZE, self._resized_buf, 'raw', 'RGBA', 0, 1)
+        self._photo = ImageTk.PhotoImage(self._pil_img)
+        self._photo_shown = False
+        
         # Control panel
         control_frame = ctk.CTkFrame(main_frame)
         control_frame.pack(fill="x")
@@ -125,109 +156,163 @@ class TrackingWindow:
         self.is_running = True
         self.tracking_thread = threading.Thread(target=self.tracking_loop, daemon=True)
         self.tracking_thread.start()
+        self.window.after(16, self._drain_ui)
         
     def tracking_loop(self):
         """Main tracking loop"""
-        cap = cv2.VideoCapture(CAMERA_INDEX)
+        import cv2  # Deferred until tracking actually starts
+        from src.utils.camera_stream import FrameReader
+        
+        # Pick the low-latency backend explicitly instead of cv2's default (MSMF buffers ~5 frames on Windows)
+        system = platform.system()
+        if system == "Windows":
+            backend = cv2.CAP_DSHOW
+        elif system == "Linux":
+            backend = cv2.CAP_V4L2
+        else:
+            backend = cv2.CAP_ANY
+        cap = cv2.VideoCapture(CAMERA_INDEX, backend)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)  # Always read the newest frame
+        # Compressed frames keep USB2 cameras at the requested FPS (raw YUY2 caps ~10 FPS at 720p)
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, CAMERA_WIDTH)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, CAMERA_HEIGHT)
         cap.set(cv2.CAP_PROP_FPS, CAMERA_FPS)
         
-        frame_count = 0
-        fps_start_time = time.time()
+        fps = 0.0  # Exponential moving average of the loop rate
+        last_frame_ts = time.time()
+        last_fps_label_ts = 0.0  # FPS label refreshes once per second, not on every jitter
+        last_ui_ts = 0.0  # Preview is capped at PREVIEW_FPS; gestures still run every frame
         
-        while self.is_running:
-            ret, frame = cap.read()
-            if not ret:
-                break
+        # Capture runs on its own thread - frames that arrive during inference replace each other
+        reader = FrameReader(cap).start()
+        try:
+            while self.is_running:
+                frame = reader.read(timeout=0.1)  # Timeout so stop is noticed
+                if frame is None:
+                    if not reader.running:
+                        break  # Camera stopped delivering frames
+                    continue
+                    
+                # Downscale once; the recognizer and the preview both use the small frame
+                small_frame = cv2.resize(frame, SMALL_SIZE, interpolation=cv2.INTER_AREA)
+                
+                # Process frame for gestures
+                processed_frame, gesture_data = self.gesture_recognizer.process_frame(small_frame)
                 
-            # Process frame for gestures
-            processed_frame, gesture_data = self.gesture_recognizer.process_frame(frame)
-            
-            # Update gesture status
-            if gesture_data:
-                gesture_type = gesture_data.get('type', 'unknown')
-                self.update_gesture_status(gesture_type)
+                # Update gesture status
+                if gesture_data:
+                    gesture_type = gesture_data.get('type', 'unknown')
+                    self._post_ui('gesture', gesture_type)
+                    
+                    # Get mouse position from landmarks
+                    mouse_pos = None
+                    if 'landmarks' in gesture_data:
+                        landmarks = gesture_data['landmarks']
+                        # Use thumb position method if available, otherwise fallback
+                        if hasattr(self.gesture_recognizer, 'get_thumb_position'):
+                            mouse_pos = self.gesture_recognizer.get_thumb_position(landmarks)
+                        else:
+                            mouse_pos = self.gesture_recognizer.get_mouse_position(
+                                landmarks, small_frame.shape[:2]
+                            )
+                    
+                    # Process gesture for mouse control
+                    self.mouse_controller.process_gesture(gesture_data, mouse_pos)
+                else:
+                    self._post_ui('gesture', "없음")
                 
-                # Get mouse position from landmarks
-                mouse_pos = None
-                if 'landmarks' in gesture_data:
-                    landmarks = gesture_data['landmarks']
-                    # Use thumb position method if available, otherwise fallback
-                    if hasattr(self.gesture_recognizer, 'get_thumb_position'):
-                        mouse_pos = self.gesture_recognizer.get_thumb_position(landmarks)
-                    else:
-                        mouse_pos = self.gesture_recognizer.get_mouse_position(
-                            landmarks, (CAMERA_HEIGHT, CAMERA_WIDTH)
-                        )
+                now = time.time()
                 
-                # Process gesture for mouse control
-                self.mouse_controller.process_gesture(gesture_data, mouse_pos)
-            else:
-                self.update_gesture_status("없음")
-            
-            # Update camera display
-            if self.show_camera:
-                self.update_camera_display(processed_frame)
-            
-            # Calculate FPS
-            frame_count += 1
-            if frame_count % 30 == 0:
-                fps = 30 / (time.time() - fps_start_time)
-                self.update_status(f"상태: 실행 중 ({fps:.1f} FPS)")
-                fps_start_time = time.time()
-        
-        cap.release()
+                # Update camera display
+                if self.show_camera and now - last_ui_ts >= 1.0 / PREVIEW_FPS:
+                    last_ui_ts = now
+                    self._post_ui('frame', processed_frame)
+                
+                # Calculate FPS - the label is refreshed at a fixed low rate
+                dt = now - last_frame_ts
+                last_frame_ts = now
+                if dt > 0:
+                    fps = 1.0 / dt if fps == 0.0 else 0.9 * fps + 0.1 / dt
+                if now - last_fps_label_ts >= 1.0:
+                    last_fps_label_ts = now
+                    self._post_ui('status', f"상태: 실행 중 ({int(fps)} FPS)")
+        finally:
+            reader.stop()
+            cap.release()  # Camera is freed even if a frame step raises
+        
+    def _post_ui(self, kind, value):
+        """Queue a UI update from the tracking thread (dropped if the UI is behind)"""
+        try:
+            self._ui_queue.put_nowait((kind, value))
+        except queue.Full:
+            pass
+    
+    def _drain_ui(self):
+        """Apply queued UI updates on the Tk thread - only the latest of each kind"""
+        latest = {}
+        while True:
+            try:
+                kind, value = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            latest[kind] = value
+        
+        if 'frame' in latest and self.show_camera:
+            self.update_camera_display(latest['frame'])
+        if 'status' in latest:
+            self.update_status(latest['status'])
+        if 'gesture' in latest:
+            self.update_gesture_status(latest['gesture'])
+        
+        if self.is_running:
+            self.window.after(16, self._drain_ui)
         
     def update_camera_display(self, frame):
         """Update camera display"""
-        try:
-            # Convert to RGB and resize
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            frame_resized = cv2.resize(frame_rgb, (640, 480))
-            
-            # Convert to PhotoImage
-            image = Image.fromarray(frame_resized)
-            photo = ImageTk.PhotoImage(image)
-            
-            # Update label
-            self.camera_label.configure(image=photo, text="")
-            self.camera_label.image = photo  # Keep reference
-        except Exception as e:
-            print(f"Camera display error: {e}")
+        import cv2
+        
+        if frame is None or not self.is_running:
+            return
+        
+        # Recognizer frames are already SMALL_SIZE - only resize anything else (preallocated buffers)
+        if frame.shape[1::-1] != SMALL_SIZE:
+            cv2.resize(frame, SMALL_SIZE, dst=self._small_buf, interpolation=cv2.INTER_AREA)
+            frame = self._small_buf
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGBA, dst=self._resized_buf)
+        
+        # Push pixels into the existing PhotoImage (_pil_img views _resized_buf)
+        self._photo.paste(self._pil_img)
+        
+        # Attach the PhotoImage to the label only once
+        if not self._photo_shown:
+            self.camera_label.configure(image=self._photo, text="")
+            self.camera_label.image = self._photo  # Keep reference
+            self._photo_shown = True
     
     def update_status(self, status):
         """Update status label"""
-        try:
-            self.status_label.configure(text=status)
-        except:
-            pass
+        # Widgets only go away after stop() - no need to guard each configure
+        if not self.is_running:
+            return
+        self.status_label.configure(text=status)
     
     def update_gesture_status(self, gesture):
         """Update gesture status label"""
-        try:
-            gesture_text = {
-                "index_finger_point": "검지 포인팅",
-                "index_finger_tap": "좌클릭",
-                "middle_finger_tap": "우클릭",
-                "thumb_up": "스크롤 업",
-                "thumb_down": "스크롤 다운",
-                "peace_sign": "피스 사인",
-                "fist": "주먹",
-                "open_hand": "손바닥",
-                "unknown": "알 수 없음",
-                "없음": "없음"
-            }.get(gesture, gesture)
-            
-            self.gesture_label.configure(text=f"제스처: {gesture_text}")
-        except:
-            pass
+        # Same gesture held across frames - leave the label alone
+        if not self.is_running or gesture == self._last_gesture:
+            return
+        self._last_gesture = gesture
+        
+        gesture_text = _GESTURE_STATUS_TEXT.get(gesture, gesture)
+        self.gesture_label.configure(text=f"제스처: {gesture_text}")
     
     def toggle_camera(self):
         """Toggle camera display"""
         self.show_camera = self.camera_toggle.get()
         if not self.show_camera:
             self.camera_label.configure(image="", text="카메라 숨김")
+            self._photo_shown = False
     
     def toggle_recording(self):
         """Toggle voice recording"""
@@ -242,12 +327,20 @@ class TrackingWindow:
     
     
     def stop(self):
-        """Stop tracking and close window"""
+        """Stop tracking and close window (once the tracking thread has exited)"""
+        if not self.is_running:
+            return
         self.is_running = False
         self.mouse_controller.set_mouse_enabled(False)
         
-        if hasattr(self, 'tracking_thread'):
-            self.tracking_thread.join(timeout=1.0)
+        # Don't join on the Tk thread - poll until the tracking thread is done
+        self.window.after(50, self._finalize_close)
+    
+    def _finalize_close(self):
+        """Destroy the window after the tracking thread has finished"""
+        if hasattr(self, 'tracking_thread') and self.tracking_thread.is_alive():
+            self.window.after(50, self._finalize_close)
+            return
         
         self.window.destroy()
         self.stop_callback()
\ No newline at end of file
@@ -0,0 +1,209 @@
+"""
+Camera capture helpers that keep frame decoding off the inference thread
+"""
+
+import threading
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import cv2
+import numpy as np
+from typing import Optional, Tuple
+
+READ_RETRY_DELAY = 0.1  # Seconds to back off after a failed camera read
+MAX_READ_FAILURES = 30  # Consecutive failures (~3 s) before the capture process gives up
+
+# OpenCV T-API - flip/resize/cvtColor on cv2.UMat frames run through OpenCL (e.g. on the iGPU)
+USE_OPENCL = cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL()
+
+
+def to_umat(frame):
+    """Wrap a frame for the OpenCL path (no-op when OpenCL is unavailable)"""
+    return cv2.UMat(frame) if USE_OPENCL else frame
+
+
+def dst_buffer(buf: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    """Preallocated dst for the NumPy path; None on the OpenCL path so OpenCV returns a UMat"""
+    return None if USE_OPENCL else buf
+
+
+def to_numpy(mat) -> np.ndarray:
+    """Download a UMat result to host memory - MediaPipe and Qt need NumPy arrays"""
+    return mat.get() if isinstance(mat, cv2.UMat) else mat
+
+
+class FrameReader:
+    """Reads an opened capture on a background thread and keeps only the newest frame
+    
+    The consumer never decodes frames that queued up in the driver while it was busy, and
+    never throws away one that is already fresh.
+    """
+    
+    def __init__(self, cap):
+        self.cap = cap  # Owned by the caller - released after stop()
+        self.frame = None
+        self.frame_cond = threading.Condition()
+        self.stop_event = threading.Event()
+        self.thread = None
+    
+    @property
+    def running(self) -> bool:
+        """False once stopped or after the camera stopped delivering frames"""
+        return self.thread is not None and self.thread.is_alive()
+    
+    def start(self):
+        """Start the capture thread"""
+        if self.thread:
+            return self
+        
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._update, daemon=True)
+        self.thread.start()
+        return self
+    
+    def _update(self):
+        """Capture loop - always overwrite with the latest decoded frame"""
+        failures = 0
+        while not self.stop_event.is_set():
+            ret, frame = self.cap.read()
+            if not ret:
+                # Camera missing or unplugged - back off instead of spinning, then give up
+                failures += 1
+                if failures >= MAX_READ_FAILURES:
+                    break
+                self.stop_event.wait(READ_RETRY_DELAY)
+                continue
+            failures = 0
+            
+            with self.frame_cond:
+                self.frame = frame
+                self.frame_cond.notify()
+    
+    def read(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """Return the newest frame not read yet, waiting up to timeout for one (None if none came)"""
+        with self.frame_cond:
+            self.frame_cond.wait_for(lambda: self.frame is not None, timeout)
+            frame, self.frame = self.frame, None
+        return frame
+    
+    def stop(self):
+        """Stop the capture thread (the caller then releases the capture)"""
+        self.stop_event.set()
+        if self.thread:
+            self.thread.join(timeout=1.0)
+            self.thread = None
+
+
+def _broadcast_frames(shm_name: str, shape: Tuple[int, int, int], src: int, fourcc: Optional[str], fps: int,
+                      frame_cond, frame_count, stop_event):
+    """Capture process body - decode camera frames straight into shared memory"""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    shared_frame = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+    
+    cap = cv2.VideoCapture(src)
+    if fourcc:
+        # e.g. 'YUYV' - raw frames skip the camera's MJPEG encode/decode round trip
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*fourcc))
+    cap.set(cv2.CAP_PROP_FRAME_WIDTH, shape[1])
+    cap.set(cv2.CAP_PROP_FRAME_HEIGHT, shape[0])
+    cap.set(cv2.CAP_PROP_FPS, fps)
+    
+    try:
+        if not cap.isOpened():
+            print(f"Camera {src} could not be opened")
+            return
+        
+        failures = 0
+        while not stop_event.is_set():
+            ret, frame = cap.read()
+            if not ret:
+                # Camera missing or unplugged - back off instead of spinning, then give up
+                failures += 1
+                if failures >= MAX_READ_FAILURES:
+                    print(f"Camera {src} stopped delivering frames")
+                    break
+                stop_event.wait(READ_RETRY_DELAY)
+                continue
+            failures = 0
+            
+            # Camera may ignore the requested size - shared buffer shape is fixed
+            if frame.shape != shape:
+                frame = cv2.resize(frame, (shape[1], shape[0]))
+            
+            with frame_cond:
+                np.copyto(shared_frame, frame)
+                frame_count.value += 1
+                frame_cond.notify_all()
+    finally:
+        cap.release()
+        del shared_frame
+        shm.close()
+
+
+class CameraBroadcaster:
+    """Captures camera frames in a separate process and hands them over through shared memory"""
+    
+    def __init__(self, src: int = 0, width: int = 640, height: int = 480, fourcc: Optional[str] = None,
+                 fps: int = 30):
+        self.src = src
+        self.shape = (height, width, 3)
+        self.fourcc = fourcc  # Requested camera pixel format, None keeps the driver default
+        self.fps = fps
+        
+        self.frame_cond = mp.Condition()
+        self.frame_count = mp.Value('L', 0, lock=False)  # Guarded by frame_cond
+        self.stop_event = mp.Event()
+        self.process = None
+        self.shm = None
+        
+        self._shared_frame = None
+        self._frame = np.empty(self.shape, dtype=np.uint8)  # Consumer-side copy
+        self._last_count = 0
+    
+    def start(self):
+        """Start the capture process"""
+        if self.process:
+            return self
+        
+        self.shm = shared_memory.SharedMemory(create=True, size=int(np.prod(self.shape)))
+        self._shared_frame = np.ndarray(self.shape, dtype=np.uint8, buffer=self.shm.buf)
+        
+        self.stop_event.clear()
+        self.process = mp.Process(
+            target=_broadcast_frames,
+            args=(self.shm.name, self.shape, self.src, self.fourcc, self.fps,
+                  self.frame_cond, self.frame_count, self.stop_event),
+            daemon=True
+        )
+        self.process.start()
+        return self
+    
+    def read(self, timeout: Optional[float] = None) -> Optional[np.ndarray]:
+        """Block until a new frame arrives and return it (None on timeout)
+        
+        The returned array is reused and overwritten by the next read() - copy it to keep it.
+        """
+        with self.frame_cond:
+            if not self.frame_cond.wait_for(lambda: self.frame_count.value != self._last_count, timeout):
+                return None
+            if self._shared_frame is None:  # Stopped while waiting
+                return None
+            self._last_count = self.frame_count.value
+            np.copyto(self._frame, self._shared_frame)
+        return self._frame
+    
+    def stop(self):
+        """Stop the capture process and free the shared memory"""
+        self.stop_event.set()
+        if self.process:
+            self.process.join(timeout=1.0)
+            if self.process.is_alive():
+                self.process.terminate()
+            self.process = None
+        
+        if self.shm:
+            # Don't pull the buffer out from under a reader that is mid-copy
+            with self.frame_cond:
+                self._shared_frame = None
+                self.shm.close()
+            self.shm.unlink()
+            self.shm = None
@@ -0,0 +1,95 @@
+"""
+Native cursor positioning - bypasses pyautogui's per-call overhead where possible
+"""
+
+import platform
+import threading
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
+
+
+@lru_cache(maxsize=1)
+def get_move_cursor() -> Callable[[int, int], None]:
+    """Pick the cheapest cursor-warp call available on this platform (resolved on first use)"""
+    system = platform.system()
+    
+    if system == "Darwin":
+        try:
+            import Quartz
+            
+            # Post real mouse events instead of CGWarpMouseCursorPosition - a warp sends no
+            # moved/dragged events (hover and pinch-drag break) and mutes the mouse ~250 ms
+            def move_cursor(x: int, y: int):
+                if Quartz.CGEventSourceButtonState(Quartz.kCGEventSourceStateCombinedSessionState,
+                                                   Quartz.kCGMouseButtonLeft):
+                    event_type = Quartz.kCGEventLeftMouseDragged
+                else:
+                    event_type = Quartz.kCGEventMouseMoved
+                event = Quartz.CGEventCreateMouseEvent(None, event_type, Quartz.CGPointMake(x, y),
+                                                       Quartz.kCGMouseButtonLeft)
+                Quartz.CGEventPost(Quartz.kCGHIDEventTap, event)
+            return move_cursor
+        except ImportError:
+            pass
+    
+    elif system == "Windows":
+        try:
+            from ctypes import windll
+            set_cursor_pos = windll.user32.SetCursorPos
+            
+            def move_cursor(x: int, y: int):
+                set_cursor_pos(x, y)
+            return move_cursor
+        except (ImportError, AttributeError):
+            pass
+    
+    # Fallback: pyautogui without its post-call sleep
+    import pyautogui
+    
+    def move_cursor(x: int, y: int):
+        pyautogui.moveTo(x, y, _pause=False)
+    return move_cursor
+
+
+class CursorMover:
+    """Moves the OS cursor on a dedicated thread, coalescing to the latest target"""
+    
+    def __init__(self):
+        self.target: Optional[Tuple[int, int]] = None
+        self.target_event = threading.Event()
+        self.running = False
+        self.thread = None
+    
+    def start(self):
+        """Start the cursor thread"""
+        if self.running:
+            return self
+        
+        self.running = True
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        return self
+    
+    def move_to(self, x: int, y: int):
+        """Set the cursor target - never blocks; intermediate targets are dropped"""
+        self.target = (x, y)
+        self.target_event.set()
+    
+    def _run(self):
+        """Cursor loop - warp to the newest target whenever one is posted"""
+        move_cursor = get_move_cursor()
+        while self.running:
+            if not self.target_event.wait(timeout=0.1):
+                continue
+            self.target_event.clear()
+            target = self.target
+            if target is not None:
+                move_cursor(*target)
+    
+    def stop(self):
+        """Stop the cursor thread"""
+        self.running = False
+        self.target_event.set()
+        if self.thread:
+            self.thread.join(timeout=1.0)
+            self.thread = None
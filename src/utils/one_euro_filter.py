@@ -0,0 +1,48 @@
+"""
+One Euro filter - speed-adaptive low-pass filter for jittery landmark coordinates
+"""
+
+import math
+from typing import Optional
+
+
+class OneEuroFilter:
+    """Smooths a scalar signal: heavy smoothing when still, little lag when moving fast"""
+    
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 0.01, d_cutoff: float = 1.0):
+        self.min_cutoff = min_cutoff  # Hz - lower removes more jitter at rest
+        self.beta = beta  # Cutoff increase per unit of speed - higher reduces lag
+        self.d_cutoff = d_cutoff  # Hz - cutoff for the speed estimate
+        self.reset()
+    
+    def reset(self):
+        """Forget the filter history (e.g. when tracking restarts)"""
+        self.x_prev: Optional[float] = None
+        self.dx_prev = 0.0
+        self.t_prev: Optional[float] = None
+    
+    @staticmethod
+    def _alpha(cutoff: float, dt: float) -> float:
+        tau = 1.0 / (2 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+    
+    def filter(self, x: float, t: float) -> float:
+        """Filter sample x taken at time t (seconds, monotonic)"""
+        if self.x_prev is None:
+            self.x_prev, self.t_prev = x, t
+            return x
+        if t <= self.t_prev:
+            return self.x_prev
+        
+        dt = t - self.t_prev
+        
+        # Smoothed speed drives the cutoff of the value filter
+        a_d = self._alpha(self.d_cutoff, dt)
+        dx = a_d * (x - self.x_prev) / dt + (1 - a_d) * self.dx_prev
+        
+        cutoff = self.min_cutoff + self.beta * abs(dx)
+        a = self._alpha(cutoff, dt)
+        x_hat = a * x + (1 - a) * self.x_prev
+        
+        self.x_prev, self.dx_prev, self.t_prev = x_hat, dx, t
+        return x_hat
@@ -0,0 +1,159 @@
+"""
+Round-trip tests for the gesture server protocol (attach / frame / complexity)
+
+The server runs in its own process, as in real use, with a stub recognizer in place of
+ThumbGestureRecognizer - MediaPipe is not needed.
+"""
+
+import os
+import time
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+import numpy as np
+import pytest
+
+from src.gesture import gesture_server
+from src.gesture.gesture_server import GestureServerClient
+
+FRAME_SHAPE = (240, 320, 3)
+
+
+class StubRecognizer:
+    """Answers every frame with what it read through shared memory and its own state"""
+    
+    def __init__(self):
+        self.model_complexity = 1
+        self.resets = 0
+    
+    def set_model_complexity(self, model_complexity):
+        self.model_complexity = model_complexity
+    
+    def reset_gesture_state(self):
+        self.resets += 1
+    
+    def process_frame(self, frame):
+        return frame, {
+            "shape": frame.shape,
+            "sum": int(frame.sum()),
+            "complexity": self.model_complexity,
+            "resets": self.resets
+        }
+    
+    def cleanup(self):
+        pass
+
+
+def _frame(value, shape=FRAME_SHAPE):
+    return np.full(shape, value, dtype=np.uint8)
+
+
+@pytest.fixture
+def runtime_dir(tmp_path, monkeypatch):
+    """Keep the socket and key file out of the real per-user directory"""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def connect(runtime_dir):
+    """Start a stub gesture server process; returns a function that connects a client"""
+    process = mp.Process(target=gesture_server.serve, args=(StubRecognizer(),), daemon=True)
+    process.start()
+    
+    def _connect():
+        # The server publishes its key and socket shortly after start
+        deadline = time.monotonic() + 10.0
+        while time.monotonic() < deadline:
+            client = GestureServerClient.connect(timeout=1.0)
+            if client is not None:
+                return client
+            time.sleep(0.05)
+        pytest.fail("gesture server did not accept a connection")
+    
+    yield _connect
+    process.terminate()
+    process.join(timeout=2.0)
+
+
+def test_frames_round_trip_through_shared_memory(connect):
+    client = connect()
+    
+    frame = _frame(7)
+    returned, gesture_data = client.process_frame(frame)
+    assert returned is frame
+    assert gesture_data["shape"] == FRAME_SHAPE
+    assert gesture_data["sum"] == 7 * frame.size
+    
+    # Same size reuses the segment, and the server sees the new pixels
+    shm_name = client.shm.name
+    _, gesture_data = client.process_frame(_frame(9))
+    assert client.shm.name == shm_name
+    assert gesture_data["sum"] == 9 * frame.size
+    
+    client.cleanup()
+
+
+def test_new_frame_size_reattaches(connect):
+    client = connect()
+    
+    client.process_frame(_frame(1))
+    old_name = client.shm.name
+    frame = _frame(2, (360, 640, 3))
+    _, gesture_data = client.process_frame(frame)
+    assert gesture_data["shape"] == (360, 640, 3)
+    assert gesture_data["sum"] == 2 * frame.size
+    
+    # The replaced segment is unlinked
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=old_name)
+    
+    client.cleanup()
+
+
+def test_complexity_is_forwarded_and_reset_per_client(connect):
+    client = connect()
+    client.set_model_complexity(0)
+    _, gesture_data = client.process_frame(_frame(0))
+    assert gesture_data["complexity"] == 0
+    assert gesture_data["resets"] == 1
+    client.cleanup()
+    
+    # The next client starts from the default model and fresh gesture state
+    client = connect()
+    _, gesture_data = client.process_frame(_frame(0))
+    assert gesture_data["complexity"] == 1
+    assert gesture_data["resets"] == 2
+    client.cleanup()
+
+
+def test_frame_before_attach_gets_no_result(connect):
+    client = connect()
+    client.conn.send(("frame",))
+    assert client.conn.recv() is None
+    client.cleanup()
+
+
+def test_server_survives_a_bad_attach(connect):
+    client = connect()
+    client.conn.send(("attach", "gesture-test-missing-segment", FRAME_SHAPE))
+    with pytest.raises(EOFError):
+        client.conn.recv()  # Server drops this client...
+    client.cleanup()
+    
+    # ...and keeps serving the next one
+    client = connect()
+    _, gesture_data = client.process_frame(_frame(4))
+    assert gesture_data["sum"] == 4 * _frame(4).size
+    client.cleanup()
+
+
+def test_connect_without_server_returns_none(runtime_dir):
+    assert GestureServerClient.connect(timeout=0.5) is None
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_endpoint_is_private(connect):
+    connect().cleanup()  # Server has published its key and socket
+    assert os.stat(gesture_server._runtime_dir()).st_mode & 0o777 == 0o700
+    assert os.stat(gesture_server._key_path()).st_mode & 0o777 == 0o600